@@ -30,8 +30,35 @@ CREATE TABLE IF NOT EXISTS units (
     lease_start  TEXT,
     lease_end    TEXT,
     sq_ft        REAL,
+    rent_escalation_percent REAL,
+    lease_start_iso       TEXT,
+    lease_end_iso         TEXT,
+    lease_date_confidence TEXT,
     FOREIGN KEY (property_id) REFERENCES properties(id)
 );
 `);
 
+// Columns added after the original schema (kept in sync with python/db.py)
+const ADDED_UNIT_COLUMNS = {
+    rent_escalation_percent: "REAL",
+    lease_start_iso: "TEXT",
+    lease_end_iso: "TEXT",
+    lease_date_confidence: "TEXT",
+};
+const unitColumns = db.prepare("PRAGMA table_info(units)").all().map((c) => c.name);
+for (const [name, type] of Object.entries(ADDED_UNIT_COLUMNS)) {
+    if (!unitColumns.includes(name)) {
+        db.exec(`ALTER TABLE units ADD COLUMN ${name} ${type}`);
+    }
+}
+
+// ISO lease dates sort as text, so expiry/occupancy queries can use these
+db.exec(`
+CREATE INDEX IF NOT EXISTS idx_units_lease_start_iso ON units (lease_start_iso);
+CREATE INDEX IF NOT EXISTS idx_units_lease_end_iso ON units (lease_end_iso);
+`);
+
+// Portfolio aggregates (agg_stats / agg_histogram) are maintained by triggers
+// installed with: python3 python/aggregates.py install
+
 export default db;
@@ -0,0 +1,231 @@
+# backend/python/aggregates.py
+#
+# Materialized aggregates for portfolio dashboards, kept in data.db:
+#
+#   agg_stats      (scope, scope_key, metric) -> count, total, min, max
+#   agg_histogram  (scope, scope_key, metric, bucket) -> count
+#
+# scope is "property" (scope_key = properties.id) or "doc_type"
+# (scope_key = "lease" / "flyer"). The tables are updated by AFTER INSERT
+# triggers on `properties` and `units`, so every insert made by server.js
+# updates them in the same transaction, and reads are a primary-key lookup
+# however many documents have been ingested.
+#
+#   python python/aggregates.py install    # create tables + triggers
+#   python python/aggregates.py rebuild    # recompute from properties/units
+#   python python/aggregates.py show [--scope=doc_type] [--key=lease]
+#
+# Only inserts are tracked; after deleting or editing rows, run `rebuild`.
+
+import json
+import sqlite3
+import sys
+
+from db import connect, fail, migrate, parse_command
+
+
+# Each metric: source table, value expression, filter, histogram bucket width
+# (None = no histogram) and the scopes it is aggregated under. Expressions
+# use {row} for the row alias (NEW inside triggers, the table in rebuilds).
+# A row whose scope key is NULL (e.g. a unit with no property_id) is left
+# out of that scope only.
+METRICS = [
+    {
+        "name": "documents",
+        "table": "properties",
+        "value": "1",
+        "where": "1",
+        "bucket_width": None,
+        "scopes": {"doc_type": "COALESCE({row}.doc_type, '')"},
+    },
+    {
+        "name": "available_sf",
+        "table": "properties",
+        "value": "{row}.available_sf",
+        "where": "{row}.available_sf IS NOT NULL",
+        "bucket_width": 5000,
+        "scopes": {"doc_type": "COALESCE({row}.doc_type, '')"},
+    },
+    {
+        # annual rent per SF (units.rent_amount is monthly base rent)
+        "name": "rent_psf",
+        "table": "units",
+        "value": "{row}.rent_amount * 12.0 / {row}.sq_ft",
+        "where": "{row}.rent_amount > 0 AND {row}.sq_ft > 0",
+        "bucket_width": 5,
+        "scopes": {
+            "property": "CAST({row}.property_id AS TEXT)",
+            "doc_type": "COALESCE((SELECT doc_type FROM properties WHERE id = {row}.property_id), '')",
+        },
+    },
+    {
+        "name": "rent_escalation_percent",
+        "table": "units",
+        "value": "{row}.rent_escalation_percent",
+        "where": "{row}.rent_escalation_percent IS NOT NULL",
+        "bucket_width": 0.5,
+        "scopes": {
+            "property": "CAST({row}.property_id AS TEXT)",
+            "doc_type": "COALESCE((SELECT doc_type FROM properties WHERE id = {row}.property_id), '')",
+        },
+    },
+]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS agg_stats (
+    scope      TEXT NOT NULL,
+    scope_key  TEXT NOT NULL,
+    metric     TEXT NOT NULL,
+    count      INTEGER NOT NULL,
+    total      REAL NOT NULL,
+    min_value  REAL,
+    max_value  REAL,
+    PRIMARY KEY (scope, scope_key, metric)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS agg_histogram (
+    scope      TEXT NOT NULL,
+    scope_key  TEXT NOT NULL,
+    metric     TEXT NOT NULL,
+    bucket     INTEGER NOT NULL,
+    count      INTEGER NOT NULL,
+    PRIMARY KEY (scope, scope_key, metric, bucket)
+) WITHOUT ROWID;
+"""
+
+
+def _bucket_expr(value, width):
+    """floor(value / width) without relying on SQLite's optional math functions."""
+    q = f"(({value}) / {float(width)})"
+    return f"(CAST({q} AS INTEGER) - ({q} < CAST({q} AS INTEGER)))"
+
+
+def _upserts(metric, row):
+    """SQL statements folding one `row` into the aggregates for `metric`."""
+    value = metric["value"].format(row=row)
+    where = metric["where"].format(row=row)
+    stmts = []
+    for scope, key_expr in metric["scopes"].items():
+        key = key_expr.format(row=row)
+        scoped_where = f"{where} AND ({key}) IS NOT NULL"
+        stmts.append(
+            f"""INSERT INTO agg_stats (scope, scope_key, metric, count, total, min_value, max_value)
+            SELECT '{scope}', {key}, '{metric["name"]}', 1, v, v, v
+            FROM (SELECT {value} AS v) WHERE {scoped_where}
+            ON CONFLICT (scope, scope_key, metric) DO UPDATE SET
+                count = count + 1,
+                total = total + excluded.total,
+                min_value = MIN(min_value, excluded.min_value),
+                max_value = MAX(max_value, excluded.max_value);"""
+        )
+        if metric["bucket_width"]:
+            bucket = _bucket_expr(value, metric["bucket_width"])
+            stmts.append(
+                f"""INSERT INTO agg_histogram (scope, scope_key, metric, bucket, count)
+                SELECT '{scope}', {key}, '{metric["name"]}', {bucket}, 1 WHERE {scoped_where}
+                ON CONFLICT (scope, scope_key, metric, bucket) DO UPDATE SET
+                    count = count + 1;"""
+            )
+    return stmts
+
+
+def install(conn):
+    """Create the aggregate tables and (re)create the insert triggers."""
+    migrate(conn)
+    with conn:
+        conn.executescript(SCHEMA)
+        for table in ("properties", "units"):
+            body = "\n".join(
+                stmt
+                for metric in METRICS
+                if metric["table"] == table
+                for stmt in _upserts(metric, "NEW")
+            )
+            conn.execute(f"DROP TRIGGER IF EXISTS agg_{table}_insert")
+            conn.execute(
+                f"CREATE TRIGGER agg_{table}_insert AFTER INSERT ON {table}\n"
+                f"BEGIN\n{body}\nEND"
+            )
+
+
+def rebuild(conn):
+    """Recompute every aggregate from scratch in a single transaction."""
+    install(conn)
+    with conn:
+        conn.execute("DELETE FROM agg_stats")
+        conn.execute("DELETE FROM agg_histogram")
+        for metric in METRICS:
+            row = metric["table"]
+            value = metric["value"].format(row=row)
+            where = metric["where"].format(row=row)
+            for scope, key_expr in metric["scopes"].items():
+                key = key_expr.format(row=row)
+                scoped_where = f"{where} AND ({key}) IS NOT NULL"
+                conn.execute(
+                    f"""INSERT INTO agg_stats (scope, scope_key, metric, count, total, min_value, max_value)
+                    SELECT '{scope}', {key}, ?, COUNT(*), SUM({value}), MIN({value}), MAX({value})
+                    FROM {row} WHERE {scoped_where} GROUP BY 2""",
+                    (metric["name"],),
+                )
+                if metric["bucket_width"]:
+                    bucket = _bucket_expr(value, metric["bucket_width"])
+                    conn.execute(
+                        f"""INSERT INTO agg_histogram (scope, scope_key, metric, bucket, count)
+                        SELECT '{scope}', {key}, ?, {bucket}, COUNT(*)
+                        FROM {row} WHERE {scoped_where} GROUP BY 2, 4""",
+                        (metric["name"],),
+                    )
+
+
+def read_stats(conn, scope, scope_key=None):
+    """Aggregates for a scope (optionally one key), with the mean filled in."""
+    query = "SELECT * FROM agg_stats WHERE scope = ?"
+    params = [scope]
+    if scope_key is not None:
+        query += " AND scope_key = ?"
+        params.append(str(scope_key))
+
+    stats = []
+    for row in conn.execute(query, params):
+        item = dict(row)
+        item["mean"] = item["total"] / item["count"] if item["count"] else None
+        stats.append(item)
+    return stats
+
+
+def read_histogram(conn, scope, scope_key, metric):
+    """[(bucket_lower_bound, count), ...] for one metric, in bucket order."""
+    width = next(m["bucket_width"] for m in METRICS if m["name"] == metric)
+    rows = conn.execute(
+        """SELECT bucket, count FROM agg_histogram
+        WHERE scope = ? AND scope_key = ? AND metric = ? ORDER BY bucket""",
+        (scope, str(scope_key), metric),
+    )
+    return [(bucket * width, count) for bucket, count in rows]
+
+
+if __name__ == "__main__":
+    command, opts, _ = parse_command(
+        sys.argv[1:], ("install", "rebuild", "show"), {"scope": str, "key": str}
+    )
+    conn = connect(opts["db"])
+
+    if command == "install":
+        install(conn)
+        print(json.dumps({"message": "Aggregate tables and triggers installed"}))
+    elif command == "rebuild":
+        rebuild(conn)
+        print(json.dumps({"message": "Aggregates rebuilt"}))
+    else:
+        scope = opts.get("scope", "doc_type")
+        try:
+            stats = read_stats(conn, scope, opts.get("key"))
+        except sqlite3.OperationalError:
+            fail("Aggregates are not installed; run `aggregates.py install`")
+        for item in stats:
+            metric = next(m for m in METRICS if m["name"] == item["metric"])
+            if metric["bucket_width"]:
+                item["histogram"] = read_histogram(
+                    conn, scope, item["scope_key"], item["metric"]
+                )
+        print(json.dumps(stats))
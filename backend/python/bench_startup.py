@@ -0,0 +1,109 @@
+# backend/python/bench_startup.py
+#
+# Measures what server.js pays on every `exec` of extract.py before any real
+# work happens, and checks it against a budget:
+#
+#   python python/bench_startup.py [--budget-ms=150] [--runs=5] [PDF]
+#
+# Prints a JSON report and exits with status 1 if the import or the
+# no-argument startup exceeds the budget. With a PDF, also times the
+# --classify-only fast path against a full extraction (reported, not gated).
+
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+EXTRACT = os.path.join(HERE, "extract.py")
+
+DEFAULT_BUDGET_MS = 150
+DEFAULT_RUNS = 5
+
+
+def import_time_ms(module="extract"):
+    """
+    Cumulative import time of `module` as reported by `python -X importtime`,
+    plus the slowest modules it pulled in.
+    """
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=HERE,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    # Lines look like: "import time:   self [us] | cumulative | name"
+    rows = []
+    for line in proc.stderr.splitlines():
+        m = re.match(r"import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)", line)
+        if m:
+            rows.append((int(m.group(2)), len(m.group(3)), m.group(4)))
+
+    # Children are listed just above their parent, indented two more spaces.
+    total_us, depth, children = 0, 0, []
+    for i, (cum, d, name) in enumerate(rows):
+        if name == module:
+            total_us, depth = cum, d
+            j = i - 1
+            while j >= 0 and rows[j][1] > depth:
+                if rows[j][1] == depth + 2:
+                    children.append((rows[j][0], rows[j][2]))
+                j -= 1
+            break
+
+    slowest = sorted(children, reverse=True)[:5]
+    return total_us / 1000, [{"module": n, "ms": c / 1000} for c, n in slowest]
+
+
+def wall_time_ms(cmd, runs):
+    """Median wall-clock time of running `cmd` in a fresh process."""
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=HERE, capture_output=True)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main(argv):
+    budget_ms = DEFAULT_BUDGET_MS
+    runs = DEFAULT_RUNS
+    pdf_path = None
+    for arg in argv:
+        if arg.startswith("--budget-ms="):
+            budget_ms = float(arg.split("=", 1)[1])
+        elif arg.startswith("--runs="):
+            runs = int(arg.split("=", 1)[1])
+        else:
+            pdf_path = os.path.abspath(arg)
+
+    import_ms, slowest = import_time_ms()
+    report = {
+        "budget_ms": budget_ms,
+        "import_ms": round(import_ms, 2),
+        "slowest_imports": slowest,
+        "interpreter_ms": round(wall_time_ms([sys.executable, "-c", "pass"], runs), 2),
+        "startup_ms": round(wall_time_ms([sys.executable, EXTRACT], runs), 2),
+    }
+
+    if pdf_path:
+        report["classify_only_ms"] = round(
+            wall_time_ms([sys.executable, EXTRACT, "--classify-only", pdf_path], runs), 2
+        )
+        report["full_extract_ms"] = round(wall_time_ms([sys.executable, EXTRACT, pdf_path], runs), 2)
+
+    report["within_budget"] = (
+        report["import_ms"] <= budget_ms and report["startup_ms"] <= budget_ms
+    )
+    print(json.dumps(report, indent=2))
+    return 0 if report["within_budget"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
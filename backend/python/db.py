@@ -0,0 +1,90 @@
+# backend/python/db.py
+
+import json
+import os
+import sqlite3
+import sys
+
+
+# Same SQLite file the Express server opens in database.js
+DB_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "data.db")
+
+
+def fail(message):
+    """Report a command-line error the way extract.py does, and exit."""
+    print(json.dumps({"error": message}))
+    sys.exit(1)
+
+
+def parse_command(argv, commands, options=None, flags=()):
+    """
+    Parse `<command> [--name=value ...] [--flag ...]` for the data.db tools.
+
+    `options` maps option names to converters (int, float, str, or any
+    callable raising ValueError on bad input); `--db=PATH` is always
+    accepted. Returns (command, opts, set_flags). Unknown commands, unknown
+    options and values the converter rejects are reported with fail().
+    """
+    options = {"db": str, **(options or {})}
+    usage = (
+        f"Usage: {' | '.join(commands)} "
+        + " ".join(f"[--{name}=...]" for name in options)
+        + "".join(f" [--{flag}]" for flag in flags)
+    )
+
+    if not argv or argv[0] not in commands:
+        fail(usage)
+
+    opts, set_flags = {"db": DB_PATH}, set()
+    for arg in argv[1:]:
+        name, has_value, value = arg[2:].partition("=")
+        if not arg.startswith("--"):
+            fail(f"Unexpected argument: {arg}")
+        elif not has_value and name in flags:
+            set_flags.add(name)
+        elif has_value and name in options:
+            try:
+                opts[name] = options[name](value)
+            except ValueError:
+                fail(f"Invalid value for --{name}: {value}")
+        else:
+            fail(f"Unknown option: {arg}. {usage}")
+
+    return argv[0], opts, set_flags
+
+
+def connect(path=DB_PATH):
+    """Open data.db with rows accessible by column name."""
+    conn = sqlite3.connect(path)
+    conn.row_factory = sqlite3.Row
+    return conn
+
+
+# Columns added to `units` after the original schema; database.js adds the
+# same ones when the server starts.
+ADDED_UNIT_COLUMNS = {
+    "rent_escalation_percent": "REAL",
+    "lease_start_iso": "TEXT",
+    "lease_end_iso": "TEXT",
+    "lease_date_confidence": "TEXT",
+}
+
+
+def migrate(conn):
+    """Bring an older data.db up to the current units schema."""
+    with conn:
+        cols = {row[1] for row in conn.execute("PRAGMA table_info(units)")}
+        for name, sql_type in ADDED_UNIT_COLUMNS.items():
+            if name not in cols:
+                conn.execute(f"ALTER TABLE units ADD COLUMN {name} {sql_type}")
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_units_lease_start_iso ON units (lease_start_iso)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_units_lease_end_iso ON units (lease_end_iso)"
+        )
+        # Rows whose dates have not been normalized yet (see lease_index.py)
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_units_dates_pending ON units (id) "
+            "WHERE lease_date_confidence IS NULL"
+        )
@@ -1,9 +1,10 @@
 # backend/python/extract.py
 
-import pdfplumber
 import re
 import json
+import os
 import sys
+from datetime import date
 
 
 def clean_number(val):
@@ -23,6 +24,121 @@ def clean_number(val):
         return v
 
 
+MONTHS = {
+    name: i + 1
+    for i, names in enumerate(
+        [
+            ("january", "jan"), ("february", "feb"), ("march", "mar"),
+            ("april", "apr"), ("may",), ("june", "jun"), ("july", "jul"),
+            ("august", "aug"), ("september", "sep", "sept"),
+            ("october", "oct"), ("november", "nov"), ("december", "dec"),
+        ]
+    )
+    for name in names
+}
+
+
+NUMERIC_DATE = re.compile(r"(\d{1,2})[-/.](\d{1,2})[-/.](\d{2}|\d{4})")
+
+
+def normalize_date(val, day_first=False):
+    """
+    Normalize a date string to ISO format (YYYY-MM-DD).
+
+    Returns (iso, confidence) where confidence is "high", or "ambiguous" for
+    numeric dates like 03/04/2024 that read differently as month/day and
+    day/month. Those are read as US month/day unless `day_first` is set.
+    Returns (None, None) if the value can't be parsed.
+    """
+    if not val:
+        return None, None
+    v = val.strip().rstrip(".,")
+
+    candidates = []
+    ambiguous = False
+
+    m = re.fullmatch(r"(\d{4})[-/.](\d{1,2})[-/.](\d{1,2})", v)
+    if m:
+        candidates.append((int(m.group(1)), int(m.group(2)), int(m.group(3))))
+
+    m = NUMERIC_DATE.fullmatch(v)
+    if m:
+        a, b, year = int(m.group(1)), int(m.group(2)), int(m.group(3))
+        if year < 100:
+            year += 2000 if year < 70 else 1900
+        month_day = [(year, a, b), (year, b, a)]   # US order, then day/month
+        candidates.extend(reversed(month_day) if day_first else month_day)
+        ambiguous = a != b and a <= 12 and b <= 12
+
+    # "January 1, 2024" / "Jan. 1st 2024" / "1 January 2024"
+    m = re.fullmatch(r"([A-Za-z]+)\.?\s+(\d{1,2})(?:st|nd|rd|th)?,?\s+(\d{4})", v)
+    if m and m.group(1).lower() in MONTHS:
+        candidates.append((int(m.group(3)), MONTHS[m.group(1).lower()], int(m.group(2))))
+    m = re.fullmatch(r"(\d{1,2})(?:st|nd|rd|th)?\s+([A-Za-z]+)\.?,?\s+(\d{4})", v)
+    if m and m.group(2).lower() in MONTHS:
+        candidates.append((int(m.group(3)), MONTHS[m.group(2).lower()], int(m.group(1))))
+
+    for year, month, day in candidates:
+        try:
+            iso = date(year, month, day).isoformat()
+        except ValueError:
+            continue
+        return iso, "ambiguous" if ambiguous else "high"
+
+    return None, None
+
+
+def normalize_lease_dates(values):
+    """
+    Normalize the dates of one document together, so that evidence from one
+    date settles the order of the others.
+
+    Returns ([iso, ...], confidence). For numeric dates:
+      - any date with a first part > 12 (25/03/2024) makes the document
+        day/month; any with a second part > 12 (03/25/2024) makes it month/day;
+        a document with both is contradictory: each date is read the only way
+        it parses (US order where either works) and flagged "ambiguous";
+      - otherwise, if every date falls on the 1st of a month in exactly one
+        reading (2/01/2024, 1/01/2029 - leases usually run from the 1st), that
+        reading is taken as settled;
+      - otherwise the dates stay "ambiguous" and are read as US month/day,
+        which is the authoritative default.
+    Confidence is None when no date could be parsed.
+    """
+    parts = [
+        (int(m.group(1)), int(m.group(2)))
+        for m in (NUMERIC_DATE.fullmatch((v or "").strip().rstrip(".,")) for v in values)
+        if m
+    ]
+
+    day_first = False
+    settled = True
+    day_first_evidence = any(a > 12 for a, _ in parts)
+    month_day_evidence = any(b > 12 for _, b in parts)
+    if day_first_evidence and month_day_evidence:
+        return [normalize_date(v)[0] for v in values], "ambiguous"
+    elif day_first_evidence:
+        day_first = True
+    elif month_day_evidence:
+        day_first = False
+    elif parts:
+        firsts_month_day = all(b == 1 for _, b in parts)
+        firsts_day_month = all(a == 1 for a, _ in parts)
+        if firsts_day_month and not firsts_month_day:
+            day_first = True
+        elif firsts_day_month == firsts_month_day:
+            settled = False
+
+    results = [normalize_date(v, day_first=day_first) for v in values]
+    isos = [iso for iso, _ in results]
+    confidences = {conf for _, conf in results if conf}
+    if not confidences:
+        return isos, None
+    if "ambiguous" in confidences and not settled:
+        return isos, "ambiguous"
+    return isos, "high"
+
+
 def parse_lease(text):
     """Parse a lease-type PDF (single premises) for key fields."""
     data = {
@@ -43,6 +159,9 @@ def parse_lease(text):
         "security_deposit_text": None,
         "renewal_option_text": None,
         "renewal_notice_days": None,
+        "lease_start_iso": None,       # normalized YYYY-MM-DD
+        "lease_end_iso": None,
+        "lease_date_confidence": None, # "high" | "ambiguous" (see normalize_lease_dates)
     }
 
 
@@ -242,6 +361,16 @@ def parse_lease(text):
             except ValueError:
                 pass
 
+
+    # NORMALIZED LEASE DATES (ISO, plus how sure we are about the reading)
+
+    (start_iso, end_iso), confidence = normalize_lease_dates(
+        [data["lease_start"], data["lease_end"]]
+    )
+    data["lease_start_iso"] = start_iso
+    data["lease_end_iso"] = end_iso
+    data["lease_date_confidence"] = confidence
+
     return data
 
 
@@ -796,34 +925,139 @@ def parse_flyer(text):
 
 
 
-def extract_data(pdf_path):
-    full_text = ""
+LEASE_PATTERN = re.compile(
+    r"\bCOMMERCIAL LEASE AGREEMENT\b|\bLEASE AGREEMENT\b", re.IGNORECASE
+)
+
+
+def classify(text):
+    """Decide whether the PDF text is a lease or a marketing flyer."""
+
+    # Lease: look for explicit lease agreement language
+    if LEASE_PATTERN.search(text):
+        return "lease"
+
+    # Otherwise treat it as a flyer (marketing / space-for-lease)
+    return "flyer"
+
+
+def read_pages(pdf):
+    """Text of every page of an open PDF, OCR'ing image-only pages."""
+    texts = [page.extract_text() or "" for page in pdf.pages]
+
+    # Scanned pages have no text layer; OCR just those pages. The OCR module
+    # (and pytesseract) is only loaded when such a page turns up.
+    if any(not text.strip() for text in texts):
+        from ocr import fill_missing_text
+
+        fill_missing_text(pdf, texts)
+
+    return texts
+
+
+def classify_pdf(pdf_path):
+    """
+    Fast path for callers that only need the doc type: stops reading pages
+    as soon as lease language is found, and only falls back to reading (and
+    OCR'ing) the whole document when no page matched.
+    """
+    import pdfplumber
+
     with pdfplumber.open(pdf_path) as pdf:
+        has_blank_page = False
         for page in pdf.pages:
             text = page.extract_text() or ""
-            full_text += text + "\n"
+            if classify(text) == "lease":
+                return "lease"
+            has_blank_page = has_blank_page or not text.strip()
 
-    # Decide whether the PDF is a lease or a marketing flyer.
+        if has_blank_page:
+            return classify("\n".join(read_pages(pdf)))
 
-    # Lease: look for explicit lease agreement language
-    if re.search(r"\bCOMMERCIAL LEASE AGREEMENT\b|\bLEASE AGREEMENT\b", full_text, re.IGNORECASE):
-        structured = parse_lease(full_text)
+    return "flyer"
 
-    # Otherwise treat it as a flyer (marketing / space-for-lease)
+
+def extract_data(pdf_path, fields=None):
+    """
+    Extract raw text and structured fields from a PDF.
+
+    `fields` optionally limits the output to the named structured fields
+    (doc_type is always kept); raw_text is only included when requested.
+    """
+    # pdfplumber pulls in pdfminer and PIL; load it only once a PDF is opened.
+    import pdfplumber
+
+    with pdfplumber.open(pdf_path) as pdf:
+        texts = read_pages(pdf)
+
+    full_text = "".join(text + "\n" for text in texts)
+
+    if classify(full_text) == "lease":
+        structured = parse_lease(full_text)
     else:
         structured = parse_flyer(full_text)
 
-    return {
-        "raw_text": full_text,
-        "structured": structured,
+    if fields is None:
+        return {
+            "raw_text": full_text,
+            "structured": structured,
+        }
+
+    result = {
+        "structured": {
+            k: v for k, v in structured.items()
+            if k == "doc_type" or k in fields
+        },
     }
+    if "raw_text" in fields:
+        result["raw_text"] = full_text
+    return result
+
+
+def output_fields():
+    """Every field name extract_data() can return (for validating --fields)."""
+    return {"raw_text", "renewal_term_years", *parse_lease(""), *parse_flyer("")}
+
+
+def _fail(message):
+    print(json.dumps({"error": message}))
+    sys.exit(1)
 
 
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "No PDF path provided"}))
-        sys.exit(1)
+    # Usage: extract.py [--classify-only] [--fields=a,b,...] PDF
+    # (db.parse_command is for the data.db tools; this one takes no command
+    # and stays free of the sqlite import)
+    usage = "Usage: extract.py [--classify-only] [--fields=a,b,...] PDF"
+    classify_only = False
+    fields = None
+    paths = []
+    for arg in sys.argv[1:]:
+        if arg == "--classify-only":
+            classify_only = True
+        elif arg.startswith("--fields="):
+            fields = {f.strip() for f in arg.split("=", 1)[1].split(",") if f.strip()}
+            if not fields:
+                _fail("No field names given for --fields")
+            unknown = sorted(fields - output_fields())
+            if unknown:
+                _fail(f"Unknown field(s) for --fields: {', '.join(unknown)}")
+        elif arg.startswith("--"):
+            _fail(f"Unknown option: {arg}. {usage}")
+        else:
+            paths.append(arg)
+
+    if not paths:
+        _fail("No PDF path provided")
+    if len(paths) > 1:
+        _fail(f"Expected one PDF path, got {len(paths)}. {usage}")
+
+    pdf_path = paths[0]
+    if not os.path.isfile(pdf_path):
+        _fail(f"PDF not found: {pdf_path}")
+
+    if classify_only:
+        print(json.dumps({"structured": {"doc_type": classify_pdf(pdf_path)}}))
+        sys.exit(0)
 
-    pdf_path = sys.argv[1]
-    result = extract_data(pdf_path)
-    print(json.dumps(result))
+    print(json.dumps(extract_data(pdf_path, fields=fields)))
@@ -0,0 +1,174 @@
+# backend/python/extract_async.py
+#
+# asyncio front end for extract_data(). pdfplumber is CPU-bound and holds
+# the GIL, so extraction runs in a process pool; the event loop only awaits
+# results. A semaphore caps the number of documents in flight, so a service
+# with thousands of queued uploads keeps at most `max_in_flight` PDFs
+# submitted at once and the rest wait (backpressure) instead of piling up
+# in the pool's queue.
+#
+#     async with AsyncExtractor(max_workers=4) as extractor:
+#         result = await extractor.extract("lease_1.pdf")
+#
+#         async for path, result in extractor.iter_extract(paths):
+#             ...  # results arrive in completion order
+#
+# Module-level extract_data_async() / iter_extract_async() use a shared
+# default extractor; its pool is shut down at interpreter exit, or earlier
+# with shutdown_default(). Workers are spawned, so a script using this
+# module must keep its entry point under `if __name__ == "__main__":`.
+
+import asyncio
+import atexit
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from extract import extract_data
+
+
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+
+class AsyncExtractor:
+    """Process pool + in-flight limit for running extract_data() from asyncio."""
+
+    def __init__(self, max_workers=DEFAULT_WORKERS, max_in_flight=None):
+        self.max_workers = max_workers
+        self.max_in_flight = max_in_flight or max_workers * 2
+        self._pool = None
+        self._slots = None
+        self._loop = None
+
+    def _ensure_started(self):
+        if self._pool is None:
+            # "spawn" rather than fork: forking a process that is running an
+            # event loop (and its threads) is unsafe. extract.py imports
+            # cheaply, so spawned workers start fast.
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+
+        # A semaphore belongs to the loop it was first used on; the pool can
+        # outlive the loop (e.g. successive asyncio.run() calls), so give
+        # each loop its own. One loop at a time should use an extractor.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+
+    async def extract(self, pdf_path, fields=None):
+        """
+        Run extract_data() in the pool. Waits for a free slot first when
+        max_in_flight documents are already being extracted.
+
+        Cancelling the caller drops the document if it has not started in a
+        worker yet; a document already being parsed runs to completion in its
+        worker and the result is discarded.
+        """
+        self._ensure_started()
+        loop = asyncio.get_running_loop()
+        async with self._slots:
+            return await loop.run_in_executor(
+                self._pool, partial(extract_data, pdf_path, fields=fields)
+            )
+
+    async def iter_extract(self, pdf_paths, fields=None):
+        """
+        Extract a batch, yielding (pdf_path, result) as each one finishes.
+
+        `pdf_paths` may be a regular or an async iterable; it is only read
+        when a slot frees up, so an unbounded queue is fine. A failed
+        document yields its exception in place of the result. Closing or
+        cancelling the iterator cancels everything still pending.
+        """
+        if hasattr(pdf_paths, "__aiter__"):
+            source = pdf_paths.__aiter__()
+
+            async def next_path():
+                return await source.__anext__()
+        else:
+            source = iter(pdf_paths)
+
+            async def next_path():
+                try:
+                    return next(source)
+                except StopIteration:
+                    raise StopAsyncIteration
+
+        self._ensure_started()
+        pending = {}
+        exhausted = False
+        try:
+            while True:
+                while not exhausted and len(pending) < self.max_in_flight:
+                    try:
+                        path = await next_path()
+                    except StopAsyncIteration:
+                        exhausted = True
+                        break
+                    task = asyncio.ensure_future(self.extract(path, fields=fields))
+                    pending[task] = path
+
+                if not pending:
+                    return
+
+                done, _ = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    path = pending.pop(task)
+                    exc = task.exception()
+                    yield path, exc if exc is not None else task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+    def close(self, wait=True):
+        """Shut the pool down; queued work that has not started is cancelled."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+        self._slots = None
+        self._loop = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        # Waiting for workers to exit would block the loop; do it in a thread.
+        await asyncio.to_thread(self.close)
+
+
+_default = None
+
+
+def _default_extractor():
+    global _default
+    if _default is None:
+        _default = AsyncExtractor()
+        atexit.register(_default.close)
+    return _default
+
+
+def shutdown_default(wait=True):
+    """Shut down the shared default extractor's pool (recreated on next use)."""
+    global _default
+    if _default is not None:
+        atexit.unregister(_default.close)
+        _default.close(wait=wait)
+        _default = None
+
+
+async def extract_data_async(pdf_path, fields=None):
+    """Async extract_data() on the shared default extractor."""
+    return await _default_extractor().extract(pdf_path, fields=fields)
+
+
+def iter_extract_async(pdf_paths, fields=None):
+    """Async iterator of (pdf_path, result) on the shared default extractor."""
+    return _default_extractor().iter_extract(pdf_paths, fields=fields)
@@ -0,0 +1,329 @@
+# backend/python/lease_index.py
+#
+# Date queries over the leases stored in the `units` table:
+#
+#   python python/lease_index.py expiring --days=180 [--from=2025-01-01]
+#   python python/lease_index.py occupied --on=2025-06-30 [--count]
+#
+# server.js stores each lease's normalized dates in units.lease_start_iso /
+# lease_end_iso (YYYY-MM-DD, so text order is date order), both indexed.
+# Rows ingested before those columns existed are normalized once by
+# backfill_lease_dates().
+#
+# The command line answers each query with a single indexed SQL range scan.
+# A long-running process (e.g. a dashboard service) should keep a
+# LiveLeaseIndex instead: it loads the dates once into sorted arrays and an
+# interval tree, picks up new inserts incrementally, and answers occupancy
+# counts in O(log n).
+
+import heapq
+import json
+import sys
+from bisect import bisect_left, bisect_right
+from datetime import date, timedelta
+
+from db import connect, migrate, parse_command
+from extract import normalize_lease_dates
+
+
+def to_ordinal(val):
+    """Date ordinal of a date or ISO/raw date string (None if it can't be parsed)."""
+    if val is None:
+        return None
+    if isinstance(val, date):
+        return val.toordinal()
+    try:
+        return date.fromisoformat(val).toordinal()
+    except ValueError:
+        iso = normalize_lease_dates([val])[0][0]
+        return date.fromisoformat(iso).toordinal() if iso else None
+
+
+def backfill_lease_dates(conn):
+    """
+    Normalize lease dates for units that don't have them yet (rows ingested
+    before the ISO columns existed). Returns the number of rows updated.
+    Rows with no parseable date are marked "unparsed" so they are not
+    revisited.
+    """
+    rows = conn.execute(
+        "SELECT id, lease_start, lease_end FROM units "
+        "WHERE lease_date_confidence IS NULL"
+    ).fetchall()
+
+    updates = []
+    for unit_id, start, end in rows:
+        (start_iso, end_iso), confidence = normalize_lease_dates([start, end])
+        updates.append((start_iso, end_iso, confidence or "unparsed", unit_id))
+
+    with conn:
+        conn.executemany(
+            "UPDATE units SET lease_start_iso = ?, lease_end_iso = ?, "
+            "lease_date_confidence = ? WHERE id = ?",
+            updates,
+        )
+    return len(updates)
+
+
+class _Node:
+    """Centered interval tree node; intervals here all contain `center`."""
+
+    __slots__ = ("center", "starts", "start_ids", "ends", "end_ids", "left", "right")
+
+
+def _build(intervals):
+    """Build a centered interval tree from (start, end, unit_id) tuples."""
+    if not intervals:
+        return None
+
+    points = sorted(p for start, end, _ in intervals for p in (start, end))
+    node = _Node()
+    node.center = points[len(points) // 2]
+
+    here, left, right = [], [], []
+    for iv in intervals:
+        if iv[1] < node.center:
+            left.append(iv)
+        elif iv[0] > node.center:
+            right.append(iv)
+        else:
+            here.append(iv)
+
+    by_start = sorted(here)
+    node.starts = [iv[0] for iv in by_start]
+    node.start_ids = [iv[2] for iv in by_start]
+    by_end = sorted(here, key=lambda iv: iv[1])
+    node.ends = [iv[1] for iv in by_end]
+    node.end_ids = [iv[2] for iv in by_end]
+
+    node.left = _build(left)
+    node.right = _build(right)
+    return node
+
+
+class LeaseIndex:
+    """
+    Static in-memory index of lease intervals, keyed by unit id.
+
+    - expiring(): sorted end dates, O(log n + k)
+    - occupancy_count(): sorted start and end arrays, O(log n)
+    - occupied_on(): centered interval tree, O(log n + k)
+
+    Leases missing either date are left out of the index.
+    """
+
+    def __init__(self, leases):
+        """`leases` is an iterable of (unit_id, start, end) with date-like values."""
+        intervals = []
+        for unit_id, start, end in leases:
+            s, e = to_ordinal(start), to_ordinal(end)
+            if s is None or e is None or e < s:
+                continue
+            intervals.append((s, e, unit_id))
+        self._load(intervals)
+
+    @classmethod
+    def from_intervals(cls, intervals):
+        """Index already-converted (start_ordinal, end_ordinal, unit_id) tuples."""
+        index = cls.__new__(cls)
+        index._load(list(intervals))
+        return index
+
+    def _load(self, intervals):
+        self.intervals = intervals
+        self._starts = sorted(iv[0] for iv in intervals)
+        by_end = sorted(intervals, key=lambda iv: iv[1])
+        self._ends = [iv[1] for iv in by_end]
+        self._end_ids = [iv[2] for iv in by_end]
+        self._root = _build(intervals)
+
+    def __len__(self):
+        return len(self.intervals)
+
+    def _expiring_range(self, start, end):
+        lo = bisect_left(self._ends, to_ordinal(start))
+        hi = bisect_right(self._ends, to_ordinal(end))
+        return lo, hi
+
+    def expiring(self, start, end):
+        """Unit ids whose lease ends between `start` and `end` inclusive, soonest first."""
+        lo, hi = self._expiring_range(start, end)
+        return self._end_ids[lo:hi]
+
+    def expiring_with_ends(self, start, end):
+        """Like expiring(), as (end_ordinal, unit_id) pairs."""
+        lo, hi = self._expiring_range(start, end)
+        return list(zip(self._ends[lo:hi], self._end_ids[lo:hi]))
+
+    def occupancy_count(self, on):
+        """Number of leases in force on `on`: started on/before it, not ended before it."""
+        x = to_ordinal(on)
+        return bisect_right(self._starts, x) - bisect_left(self._ends, x)
+
+    def occupied_on(self, on):
+        """Unit ids with a lease in force on `on`."""
+        x = to_ordinal(on)
+        ids = []
+        node = self._root
+        while node is not None:
+            if x < node.center:
+                ids.extend(node.start_ids[: bisect_right(node.starts, x)])
+                node = node.left
+            elif x > node.center:
+                ids.extend(node.end_ids[bisect_left(node.ends, x):])
+                node = node.right
+            else:
+                ids.extend(node.start_ids)
+                break
+        return ids
+
+
+class LiveLeaseIndex:
+    """
+    LeaseIndex over data.db that stays current across inserts.
+
+    Units inserted since the last build are kept in a small unsorted list
+    that queries scan alongside the index; once that list grows past
+    `rebuild_fraction` of the index (or `rebuild_min` rows) the index is
+    rebuilt. Changes are detected with PRAGMA data_version, so inserts from
+    server.js are picked up on the next query. Like the aggregates, only
+    inserts are tracked: call reload() after deleting or editing units.
+    """
+
+    def __init__(self, conn, rebuild_min=1024, rebuild_fraction=0.1):
+        self.conn = conn
+        self.rebuild_min = rebuild_min
+        self.rebuild_fraction = rebuild_fraction
+        self.reload()
+
+    def _db_version(self):
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, self.conn.total_changes
+
+    def _max_unit_id(self):
+        return self.conn.execute("SELECT COALESCE(MAX(id), 0) FROM units").fetchone()[0]
+
+    def _fetch(self, after_id, upto_id):
+        rows = self.conn.execute(
+            "SELECT id, lease_start_iso, lease_end_iso FROM units "
+            "WHERE id > ? AND id <= ? "
+            "AND lease_start_iso IS NOT NULL AND lease_end_iso IS NOT NULL",
+            (after_id, upto_id),
+        )
+        return [(row[0], row[1], row[2]) for row in rows]
+
+    def reload(self):
+        migrate(self.conn)
+        backfill_lease_dates(self.conn)
+        # Take the version first: anything committed while loading shows up
+        # as a change on the next refresh().
+        self._version = self._db_version()
+        self._max_id = self._max_unit_id()
+        self._index = LeaseIndex(self._fetch(0, self._max_id))
+        self._recent = []
+
+    def refresh(self):
+        """Fold in units inserted since the last query (cheap when nothing changed)."""
+        if self._db_version() == self._version:
+            return
+
+        backfill_lease_dates(self.conn)
+        self._version = self._db_version()
+        max_id = self._max_unit_id()
+        for unit_id, start, end in self._fetch(self._max_id, max_id):
+            s, e = to_ordinal(start), to_ordinal(end)
+            if e >= s:
+                self._recent.append((s, e, unit_id))
+        self._max_id = max_id
+
+        if len(self._recent) > max(self.rebuild_min, self.rebuild_fraction * len(self._index)):
+            self._index = LeaseIndex.from_intervals(self._index.intervals + self._recent)
+            self._recent = []
+
+    def __len__(self):
+        self.refresh()
+        return len(self._index) + len(self._recent)
+
+    def expiring(self, start, end):
+        self.refresh()
+        lo, hi = to_ordinal(start), to_ordinal(end)
+        recent = sorted((e, uid) for s, e, uid in self._recent if lo <= e <= hi)
+        merged = heapq.merge(
+            self._index.expiring_with_ends(start, end), recent, key=lambda pair: pair[0]
+        )
+        return [uid for _, uid in merged]
+
+    def expiring_within(self, days, today=None):
+        today = today or date.today()
+        return self.expiring(today, today + timedelta(days=days))
+
+    def occupancy_count(self, on):
+        self.refresh()
+        x = to_ordinal(on)
+        return self._index.occupancy_count(on) + sum(
+            1 for s, e, _ in self._recent if s <= x <= e
+        )
+
+    def occupied_on(self, on):
+        self.refresh()
+        x = to_ordinal(on)
+        return self._index.occupied_on(on) + [
+            uid for s, e, uid in self._recent if s <= x <= e
+        ]
+
+
+# ---------------- one-shot SQL queries (command line) ----------------
+
+def sql_expiring(conn, start, end):
+    """Units whose lease ends between two ISO dates, via idx_units_lease_end_iso."""
+    return [
+        dict(row)
+        for row in conn.execute(
+            "SELECT * FROM units WHERE lease_end_iso BETWEEN ? AND ? "
+            "ORDER BY lease_end_iso, id",
+            (start, end),
+        )
+    ]
+
+
+def sql_occupied(conn, on, count_only=False):
+    """Units with a lease in force on an ISO date."""
+    where = "lease_start_iso <= ? AND lease_end_iso >= ?"
+    if count_only:
+        return conn.execute(f"SELECT COUNT(*) FROM units WHERE {where}", (on, on)).fetchone()[0]
+    return [
+        dict(row)
+        for row in conn.execute(f"SELECT * FROM units WHERE {where} ORDER BY id", (on, on))
+    ]
+
+
+def _cli_date(value):
+    ordinal = to_ordinal(value)
+    if ordinal is None:
+        raise ValueError(value)
+    return date.fromordinal(ordinal)
+
+
+if __name__ == "__main__":
+    command, opts, flags = parse_command(
+        sys.argv[1:],
+        ("expiring", "occupied"),
+        {"days": int, "from": _cli_date, "on": _cli_date},
+        flags=("count",),
+    )
+    conn = connect(opts["db"])
+    migrate(conn)
+    backfill_lease_dates(conn)
+
+    if command == "expiring":
+        start = opts.get("from", date.today())
+        end = start + timedelta(days=opts.get("days", 180))
+        units = sql_expiring(conn, start.isoformat(), end.isoformat())
+    else:
+        on = opts.get("on", date.today()).isoformat()
+        if "count" in flags:
+            print(json.dumps({"count": sql_occupied(conn, on, count_only=True)}))
+            sys.exit(0)
+        units = sql_occupied(conn, on)
+
+    print(json.dumps({"count": len(units), "units": units}))
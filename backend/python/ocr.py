@@ -0,0 +1,149 @@
+# backend/python/ocr.py
+
+import hashlib
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from render import CACHE_ROOT
+
+try:
+    import pytesseract
+except ImportError:  # OCR is optional; text-layer PDFs don't need it
+    pytesseract = None
+
+
+OCR_CACHE_DIR = os.path.join(CACHE_ROOT, "ocr")
+
+OCR_RESOLUTION = 300                             # dpi used for OCR rasters
+OCR_MAX_WORKERS = min(4, os.cpu_count() or 1)    # concurrent tesseract runs
+
+
+def ocr_available():
+    """True when pytesseract and the tesseract binary are both usable."""
+    if pytesseract is None:
+        return False
+    try:
+        pytesseract.get_tesseract_version()
+    except Exception:
+        return False
+    return True
+
+
+def is_image_only(page, text):
+    """A page needs OCR when it has no text layer but does carry images."""
+    return not text.strip() and bool(page.images)
+
+
+def _image_key(image):
+    """Hash of the rendered page pixels, used as the OCR cache key."""
+    h = hashlib.sha256()
+    h.update(f"{image.mode}:{image.size[0]}x{image.size[1]}:".encode())
+    h.update(image.tobytes())
+    return h.hexdigest()
+
+
+def _cache_path(key):
+    return os.path.join(OCR_CACHE_DIR, key[:2], key + ".txt")
+
+
+def _read_cache(key):
+    path = _cache_path(key)
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            return f.read()
+    return None
+
+
+def _write_cache(key, text):
+    path = _cache_path(key)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
+
+def _run_ocr(key, image, page_number):
+    """
+    OCR one page image. A tesseract failure (error, timeout, unreadable
+    image) leaves the page without text, as it was before OCR existed,
+    and is not cached so the page is retried on the next extraction.
+    """
+    try:
+        text = pytesseract.image_to_string(image)
+    except Exception as exc:
+        print(f"OCR failed for page {page_number}: {exc}", file=sys.stderr)
+        return ""
+    _write_cache(key, text)
+    return text
+
+
+def fill_missing_text(pdf, texts, max_workers=OCR_MAX_WORKERS):
+    """
+    OCR the image-only pages of an open pdfplumber document.
+
+    `texts` holds the text-layer output for each page and is updated in place:
+    pages that already have text are left alone, image-only pages are looked
+    up in the per-page cache and OCR'd only on a miss. Rasterising stays on
+    the calling thread (pdfplumber is not thread-safe); tesseract runs in a
+    bounded thread pool, with at most 2 * max_workers page images held in
+    memory at once.
+    """
+    targets = [
+        i for i, page in enumerate(pdf.pages) if is_image_only(page, texts[i])
+    ]
+    if not targets:
+        return texts
+
+    if not ocr_available():
+        print(
+            f"OCR skipped for {len(targets)} image-only page(s): "
+            "pytesseract/tesseract not installed",
+            file=sys.stderr,
+        )
+        return texts
+
+    window = max(1, max_workers) * 2
+    pending = {}    # future -> page indices waiting on it
+    in_flight = {}  # cache key -> future, so repeated pages are OCR'd once
+
+    def collect(futures):
+        for fut in futures:
+            text = fut.result()
+            for j in pending.pop(fut):
+                texts[j] = text
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+        for i in targets:
+            try:
+                image = pdf.pages[i].to_image(resolution=OCR_RESOLUTION).original
+            except Exception as exc:
+                print(f"OCR skipped for page {i + 1}: {exc}", file=sys.stderr)
+                continue
+            key = _image_key(image)
+
+            if key in in_flight:
+                fut = in_flight[key]
+                if fut in pending:
+                    pending[fut].append(i)
+                else:
+                    texts[i] = fut.result()
+                continue
+
+            cached = _read_cache(key)
+            if cached is not None:
+                texts[i] = cached
+                continue
+
+            if len(pending) >= window:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+
+            fut = pool.submit(_run_ocr, key, image, i + 1)
+            in_flight[key] = fut
+            pending[fut] = [i]
+
+        collect(list(pending))
+
+    return texts
@@ -0,0 +1,304 @@
+# backend/python/queries.py
+#
+# Read-side query layer over the properties / units tables in data.db.
+#
+# - Keyset pagination: pages are "rows with id > after", ORDER BY id, so
+#   page 1000 costs the same as page 1 (no OFFSET scans).
+# - Projection: only the requested columns are selected (checked against
+#   the table schema).
+# - Search: every term matches as a case-insensitive substring, like
+#   GET /search. Terms of 3+ characters go through an FTS5 trigram index;
+#   shorter ones (which trigrams can't index) use LIKE '%term%' and scan
+#   forward in id order only until the page is full.
+# - Cost: an unfiltered page is an id range read. A filtered page reads
+#   only the matching ids (trigram / rent index), but those are sorted by
+#   id for each page, so deep pages of a broad filter cost more.
+# - Caching: results are kept in a small LRU cache that is dropped whenever
+#   the database changes, including inserts made by server.js from another
+#   connection (detected with PRAGMA data_version).
+#
+#   python python/queries.py install
+#   python python/queries.py units [--after=ID] [--limit=N] [--columns=a,b]
+#   python python/queries.py properties [--q=TEXT] [--doc_type=lease] [...]
+#   python python/queries.py search [--unit_number=21] [--min_rent=] [--max_rent=] [...]
+
+import json
+import sys
+from collections import OrderedDict
+
+from db import connect, fail, parse_command
+
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+DEFAULT_CACHE_SIZE = 256
+
+SCHEMA = """
+CREATE INDEX IF NOT EXISTS idx_units_property_id ON units (property_id);
+CREATE INDEX IF NOT EXISTS idx_units_rent_amount ON units (rent_amount);
+CREATE INDEX IF NOT EXISTS idx_properties_doc_type ON properties (doc_type);
+
+-- substring search can't use a b-tree; drop the prefix indexes of earlier installs
+DROP INDEX IF EXISTS idx_units_unit_number;
+DROP INDEX IF EXISTS idx_properties_name;
+DROP INDEX IF EXISTS idx_properties_address;
+
+CREATE VIRTUAL TABLE IF NOT EXISTS units_fts USING fts5(
+    unit_number, content='units', content_rowid='id', tokenize='trigram'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS properties_fts USING fts5(
+    property_name, address, content='properties', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS units_fts_insert AFTER INSERT ON units BEGIN
+    INSERT INTO units_fts (rowid, unit_number) VALUES (NEW.id, NEW.unit_number);
+END;
+CREATE TRIGGER IF NOT EXISTS units_fts_delete AFTER DELETE ON units BEGIN
+    INSERT INTO units_fts (units_fts, rowid, unit_number)
+    VALUES ('delete', OLD.id, OLD.unit_number);
+END;
+CREATE TRIGGER IF NOT EXISTS units_fts_update AFTER UPDATE OF unit_number ON units BEGIN
+    INSERT INTO units_fts (units_fts, rowid, unit_number)
+    VALUES ('delete', OLD.id, OLD.unit_number);
+    INSERT INTO units_fts (rowid, unit_number) VALUES (NEW.id, NEW.unit_number);
+END;
+
+CREATE TRIGGER IF NOT EXISTS properties_fts_insert AFTER INSERT ON properties BEGIN
+    INSERT INTO properties_fts (rowid, property_name, address)
+    VALUES (NEW.id, NEW.property_name, NEW.address);
+END;
+CREATE TRIGGER IF NOT EXISTS properties_fts_delete AFTER DELETE ON properties BEGIN
+    INSERT INTO properties_fts (properties_fts, rowid, property_name, address)
+    VALUES ('delete', OLD.id, OLD.property_name, OLD.address);
+END;
+CREATE TRIGGER IF NOT EXISTS properties_fts_update AFTER UPDATE OF property_name, address ON properties BEGIN
+    INSERT INTO properties_fts (properties_fts, rowid, property_name, address)
+    VALUES ('delete', OLD.id, OLD.property_name, OLD.address);
+    INSERT INTO properties_fts (rowid, property_name, address)
+    VALUES (NEW.id, NEW.property_name, NEW.address);
+END;
+"""
+
+
+def install(conn):
+    """Create the indexes, FTS tables and sync triggers, and index existing rows."""
+    with conn:
+        conn.executescript(SCHEMA)
+        conn.execute("INSERT INTO units_fts (units_fts) VALUES ('rebuild')")
+        conn.execute("INSERT INTO properties_fts (properties_fts) VALUES ('rebuild')")
+
+
+def _fts_phrase(text):
+    """FTS5 phrase query for a literal substring."""
+    return '"' + text.replace('"', '""') + '"'
+
+
+def _like_substring(text):
+    """LIKE pattern matching `text` as a literal substring (escape char: \\)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return "%" + escaped + "%"
+
+
+class QueryLayer:
+    """Cached, paginated reads over properties and units."""
+
+    def __init__(self, conn, cache_size=DEFAULT_CACHE_SIZE):
+        self.conn = conn
+        self.cache_size = cache_size
+        self._cache = OrderedDict()
+        self._version = None
+        self._columns = {}
+
+    # ---------------- cache ----------------
+
+    def _db_version(self):
+        # data_version changes when another connection commits; total_changes
+        # covers writes made through this connection.
+        data_version = self.conn.execute("PRAGMA data_version").fetchone()[0]
+        return data_version, self.conn.total_changes
+
+    def _cached(self, key, compute):
+        version = self._db_version()
+        if version != self._version:
+            self._cache.clear()
+            self._columns.clear()
+            self._version = version
+
+        if key in self._cache:
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+        result = compute()
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return result
+
+    def invalidate(self):
+        self._cache.clear()
+        self._version = None
+
+    # ---------------- helpers ----------------
+
+    def _projection(self, table, columns):
+        if table not in self._columns:
+            self._columns[table] = [
+                row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")
+            ]
+        valid = self._columns[table]
+        if not columns:
+            return valid
+        unknown = [c for c in columns if c not in valid]
+        if unknown:
+            raise ValueError(f"Unknown {table} column(s): {', '.join(unknown)}")
+        # id is always selected: it is the pagination key
+        return ["id"] + [c for c in columns if c != "id"]
+
+    def _page(self, table, columns, where, params, after_id, limit):
+        cols = self._projection(table, columns)
+        limit = max(1, min(int(limit or DEFAULT_PAGE_SIZE), MAX_PAGE_SIZE))
+        clauses = ["id > ?"] + where
+        query = (
+            f"SELECT {', '.join(cols)} FROM {table} "
+            f"WHERE {' AND '.join(clauses)} ORDER BY id LIMIT ?"
+        )
+        rows = [
+            dict(row)
+            for row in self.conn.execute(query, [int(after_id or 0), *params, limit + 1])
+        ]
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        return {
+            "rows": rows,
+            "next_after": rows[-1]["id"] if has_more else None,
+        }
+
+    # ---------------- queries ----------------
+
+    def list_units(self, columns=None, after_id=0, limit=DEFAULT_PAGE_SIZE):
+        key = ("units", tuple(columns or ()), after_id, limit)
+        return self._cached(
+            key, lambda: self._page("units", columns, [], [], after_id, limit)
+        )
+
+    def list_properties(self, columns=None, after_id=0, limit=DEFAULT_PAGE_SIZE):
+        key = ("properties", tuple(columns or ()), after_id, limit)
+        return self._cached(
+            key, lambda: self._page("properties", columns, [], [], after_id, limit)
+        )
+
+    def search_units(
+        self,
+        unit_number=None,
+        min_rent=None,
+        max_rent=None,
+        columns=None,
+        after_id=0,
+        limit=DEFAULT_PAGE_SIZE,
+    ):
+        """
+        Same filters as GET /search: unit_number matches as a substring
+        (trigram index for 3+ characters, LIKE scan below that).
+        """
+        where, params = [], []
+        if unit_number:
+            if len(unit_number) >= 3:
+                where.append("id IN (SELECT rowid FROM units_fts WHERE units_fts MATCH ?)")
+                params.append("unit_number : " + _fts_phrase(unit_number))
+            else:
+                where.append("unit_number LIKE ? ESCAPE '\\'")
+                params.append(_like_substring(unit_number))
+        if min_rent is not None:
+            where.append("rent_amount >= ?")
+            params.append(float(min_rent))
+        if max_rent is not None:
+            where.append("rent_amount <= ?")
+            params.append(float(max_rent))
+
+        key = ("search_units", unit_number, min_rent, max_rent,
+               tuple(columns or ()), after_id, limit)
+        return self._cached(
+            key, lambda: self._page("units", columns, where, params, after_id, limit)
+        )
+
+    def search_properties(
+        self,
+        q=None,
+        doc_type=None,
+        columns=None,
+        after_id=0,
+        limit=DEFAULT_PAGE_SIZE,
+    ):
+        """Properties whose name or address contains `q` (case-insensitive)."""
+        where, params = [], []
+        if q:
+            if len(q) >= 3:
+                where.append("id IN (SELECT rowid FROM properties_fts WHERE properties_fts MATCH ?)")
+                params.append(_fts_phrase(q))
+            else:
+                where.append(
+                    "(property_name LIKE ? ESCAPE '\\' OR address LIKE ? ESCAPE '\\')"
+                )
+                params.extend([_like_substring(q)] * 2)
+        if doc_type:
+            where.append("doc_type = ?")
+            params.append(doc_type)
+
+        key = ("search_properties", q, doc_type, tuple(columns or ()), after_id, limit)
+        return self._cached(
+            key,
+            lambda: self._page("properties", columns, where, params, after_id, limit),
+        )
+
+
+def _columns(value):
+    return [c.strip() for c in value.split(",") if c.strip()]
+
+
+if __name__ == "__main__":
+    command, opts, _ = parse_command(
+        sys.argv[1:],
+        ("install", "units", "properties", "search"),
+        {
+            "after": int,
+            "limit": int,
+            "columns": _columns,
+            "q": str,
+            "doc_type": str,
+            "unit_number": str,
+            "min_rent": float,
+            "max_rent": float,
+        },
+    )
+    conn = connect(opts["db"])
+
+    if command == "install":
+        install(conn)
+        print(json.dumps({"message": "Query indexes installed"}))
+        sys.exit(0)
+
+    layer = QueryLayer(conn)
+    page = {
+        "columns": opts.get("columns"),
+        "after_id": opts.get("after", 0),
+        "limit": opts.get("limit", DEFAULT_PAGE_SIZE),
+    }
+
+    try:
+        if command == "units":
+            result = layer.list_units(**page)
+        elif command == "properties":
+            result = layer.search_properties(
+                q=opts.get("q"), doc_type=opts.get("doc_type"), **page
+            )
+        else:
+            result = layer.search_units(
+                unit_number=opts.get("unit_number"),
+                min_rent=opts.get("min_rent"),
+                max_rent=opts.get("max_rent"),
+                **page,
+            )
+    except ValueError as exc:
+        fail(str(exc))
+
+    print(json.dumps(result))
@@ -0,0 +1,193 @@
+# backend/python/records.py
+#
+# Slotted record types for extraction results. parse_lease / parse_flyer
+# return plain dicts (that is what the web API sends), but batch jobs that
+# keep a whole corpus in memory should hold these records instead: no
+# per-instance __dict__, tuples instead of lists, no raw_text.
+#
+#   python python/records.py a.pdf b.pdf ... > corpus.json
+#
+# writes the batch with dumps_compact(): one column list per doc type and
+# one JSON array per record, instead of repeating every key for every row.
+
+import json
+import sys
+from dataclasses import dataclass, fields
+
+
+# Low-cardinality strings are interned so a large batch shares one copy.
+INTERNED_FIELDS = {"unit_type", "lease_rate_type", "zoning", "lease_date_confidence"}
+
+# Keys that parse_lease / parse_flyer only set when found.
+OPTIONAL_FIELDS = {"renewal_term_years"}
+
+
+def _intern(name, value):
+    if name in INTERNED_FIELDS and isinstance(value, str):
+        return sys.intern(value)
+    return value
+
+
+@dataclass(slots=True)
+class Contact:
+    name: str | None = None
+    phone: str | None = None
+    email: str | None = None
+
+    def to_dict(self):
+        return {"name": self.name, "phone": self.phone, "email": self.email}
+
+    def to_row(self):
+        return [self.name, self.phone, self.email]
+
+
+@dataclass(slots=True)
+class LeaseRecord:
+    property_name: str | None = None
+    address: str | None = None
+    tenant: str | None = None
+    suite: str | None = None
+    square_feet: float | None = None
+    base_rent: float | None = None
+    lease_start: str | None = None
+    lease_end: str | None = None
+    unit_type: str | None = None
+    additional_features: tuple = ()
+    rent_escalation_percent: float | None = None
+    rent_escalation_text: str | None = None
+    security_deposit_amount: float | None = None
+    security_deposit_text: str | None = None
+    renewal_option_text: str | None = None
+    renewal_notice_days: int | None = None
+    lease_start_iso: str | None = None
+    lease_end_iso: str | None = None
+    lease_date_confidence: str | None = None
+    renewal_term_years: int | None = None
+
+    doc_type = "lease"
+
+    @classmethod
+    def from_dict(cls, data):
+        kwargs = {
+            f.name: _intern(f.name, data.get(f.name)) for f in fields(cls)
+        }
+        kwargs["additional_features"] = tuple(data.get("additional_features") or ())
+        return cls(**kwargs)
+
+    def to_dict(self):
+        """Same shape (and key order) as parse_lease()."""
+        data = {"doc_type": self.doc_type}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if f.name in OPTIONAL_FIELDS and value is None:
+                continue
+            data[f.name] = value
+        data["additional_features"] = list(self.additional_features)
+        return data
+
+    def to_row(self):
+        row = [getattr(self, f.name) for f in fields(self)]
+        row[COLUMNS["lease"].index("additional_features")] = list(self.additional_features)
+        return row
+
+
+@dataclass(slots=True)
+class FlyerRecord:
+    property_name: str | None = None
+    address: str | None = None
+    available_sf: float | None = None
+    building_size_sf: float | None = None
+    site_area_acres: float | None = None
+    site_area_sf: float | None = None
+    lease_rate_psf: float | None = None
+    lease_rate_type: str | None = None
+    nnn_psf: float | None = None
+    year_built: int | None = None
+    zoning: str | None = None
+    parking_spaces: int | None = None
+    contacts: tuple = ()
+
+    doc_type = "flyer"
+
+    @classmethod
+    def from_dict(cls, data):
+        kwargs = {
+            f.name: _intern(f.name, data.get(f.name)) for f in fields(cls)
+        }
+        kwargs["contacts"] = tuple(
+            Contact(c.get("name"), c.get("phone"), c.get("email"))
+            for c in data.get("contacts") or ()
+        )
+        return cls(**kwargs)
+
+    def to_dict(self):
+        """Same shape (and key order) as parse_flyer()."""
+        data = {"doc_type": self.doc_type}
+        for f in fields(self):
+            data[f.name] = getattr(self, f.name)
+        data["contacts"] = [c.to_dict() for c in self.contacts]
+        return data
+
+    def to_row(self):
+        row = [getattr(self, f.name) for f in fields(self)]
+        row[COLUMNS["flyer"].index("contacts")] = [c.to_row() for c in self.contacts]
+        return row
+
+
+RECORD_TYPES = {"lease": LeaseRecord, "flyer": FlyerRecord}
+COLUMNS = {
+    doc_type: [f.name for f in fields(cls)] for doc_type, cls in RECORD_TYPES.items()
+}
+
+
+def from_structured(structured):
+    """Record for a `structured` dict as returned by extract_data()."""
+    return RECORD_TYPES[structured.get("doc_type") or "lease"].from_dict(structured)
+
+
+def extract_record(pdf_path):
+    """Like extract_data(), but returns a compact record and drops raw_text."""
+    from extract import extract_data
+
+    return from_structured(extract_data(pdf_path)["structured"])
+
+
+def dumps_compact(records):
+    """
+    Serialize records column-wise:
+
+        {"lease": {"columns": [...], "rows": [[...], ...]}, "flyer": {...}}
+
+    Contacts are stored as [name, phone, email] triples.
+    """
+    out = {}
+    for record in records:
+        group = out.setdefault(
+            record.doc_type, {"columns": COLUMNS[record.doc_type], "rows": []}
+        )
+        group["rows"].append(record.to_row())
+    return json.dumps(out, separators=(",", ":"))
+
+
+def loads_compact(text):
+    """Inverse of dumps_compact(); returns a list of records."""
+    records = []
+    for doc_type, group in json.loads(text).items():
+        cls = RECORD_TYPES[doc_type]
+        for row in group["rows"]:
+            data = dict(zip(group["columns"], row))
+            if doc_type == "flyer":
+                data["contacts"] = [
+                    {"name": n, "phone": p, "email": e}
+                    for n, p, e in data.get("contacts") or ()
+                ]
+            records.append(cls.from_dict(data))
+    return records
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "No PDF path provided"}))
+        sys.exit(1)
+
+    print(dumps_compact(extract_record(path) for path in sys.argv[1:]))
@@ -0,0 +1,129 @@
+# backend/python/render.py
+
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import pdfplumber
+
+
+# Cached artifacts live under backend/cache/, keyed by the SHA-256 of the PDF
+# bytes, so re-uploading the same file (under any name) reuses earlier work.
+CACHE_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "cache")
+PAGE_CACHE_DIR = os.path.join(CACHE_ROOT, "pages")
+
+RASTER_RESOLUTION = 110    # dpi for the mid-resolution page image
+THUMBNAIL_WIDTH = 160      # px, thumbnails are downscaled from the raster
+
+
+def file_digest(pdf_path):
+    """SHA-256 hex digest of a file's contents."""
+    h = hashlib.sha256()
+    with open(pdf_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _render_page_range(pdf_path, page_numbers, out_dir):
+    """Render a contiguous run of pages; runs inside a worker process."""
+    pages = []
+    with pdfplumber.open(pdf_path) as pdf:
+        for n in page_numbers:
+            page = pdf.pages[n]
+            image = page.to_image(resolution=RASTER_RESOLUTION).original
+
+            # JPEG keeps photo-heavy flyer pages to a fraction of the PNG size
+            raster_name = f"page-{n + 1}.jpg"
+            image.convert("RGB").save(
+                os.path.join(out_dir, raster_name), quality=85, optimize=True
+            )
+
+            thumb = image.copy()
+            thumb.thumbnail((THUMBNAIL_WIDTH, THUMBNAIL_WIDTH * 4))
+            thumb_name = f"page-{n + 1}-thumb.png"
+            thumb.save(os.path.join(out_dir, thumb_name), optimize=True)
+
+            pages.append(
+                {
+                    "page": n + 1,
+                    "width": float(page.width),
+                    "height": float(page.height),
+                    "raster": raster_name,
+                    "thumbnail": thumb_name,
+                }
+            )
+    return pages
+
+
+def render_pages(pdf_path, max_workers=None):
+    """
+    Render a thumbnail and a mid-resolution raster for every page of the PDF,
+    spreading pages across worker processes. Returns the cache manifest:
+
+        {"digest": "<sha256>", "page_count": N, "pages": [{page, width,
+         height, raster, thumbnail}, ...]}
+
+    Image names are relative to PAGE_CACHE_DIR/<digest>/. A cached manifest is
+    returned as-is without reopening the PDF.
+    """
+    digest = file_digest(pdf_path)
+    out_dir = os.path.join(PAGE_CACHE_DIR, digest)
+    manifest_path = os.path.join(out_dir, "manifest.json")
+
+    if os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            return json.load(f)
+
+    with pdfplumber.open(pdf_path) as pdf:
+        page_count = len(pdf.pages)
+
+    os.makedirs(out_dir, exist_ok=True)
+
+    # Each worker opens the PDF once and renders a contiguous chunk of pages,
+    # rather than re-parsing the whole file for every single page.
+    workers = max(1, min(page_count, max_workers or os.cpu_count() or 1))
+    chunk = -(-page_count // workers) if page_count else 0
+    ranges = [
+        range(start, min(start + chunk, page_count))
+        for start in range(0, page_count, chunk or 1)
+    ]
+
+    pages = []
+    if workers == 1:
+        for r in ranges:
+            pages.extend(_render_page_range(pdf_path, r, out_dir))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_render_page_range, pdf_path, r, out_dir)
+                for r in ranges
+            ]
+            for fut in futures:
+                pages.extend(fut.result())
+
+    manifest = {
+        "digest": digest,
+        "page_count": page_count,
+        "pages": pages,
+    }
+
+    # Write the manifest last (atomically) so a half-rendered directory is
+    # never mistaken for a complete cache entry.
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(manifest, f)
+    os.replace(tmp_path, manifest_path)
+
+    return manifest
+
+
+if __name__ == "__main__":
+    # server.js runs this as a detached process so /extract never waits on it.
+    if len(sys.argv) < 2:
+        print(json.dumps({"error": "No PDF path provided"}))
+        sys.exit(1)
+
+    print(json.dumps(render_pages(sys.argv[1])))
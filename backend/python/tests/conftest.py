@@ -0,0 +1,48 @@
+# backend/python/tests/conftest.py
+
+import os
+import sqlite3
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from db import migrate  # noqa: E402
+
+
+# The original tables from database.js; migrate() adds the later columns.
+BASE_SCHEMA = """
+CREATE TABLE properties (
+    id               INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_name    TEXT,
+    address          TEXT,
+    doc_type         TEXT,
+    available_sf     REAL,
+    building_size_sf REAL,
+    clear_height     TEXT
+);
+
+CREATE TABLE units (
+    id           INTEGER PRIMARY KEY AUTOINCREMENT,
+    property_id  INTEGER,
+    unit_number  TEXT,
+    unit_type    TEXT,
+    rent_amount  REAL,
+    tenant_name  TEXT,
+    lease_start  TEXT,
+    lease_end    TEXT,
+    sq_ft        REAL,
+    FOREIGN KEY (property_id) REFERENCES properties(id)
+);
+"""
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.executescript(BASE_SCHEMA)
+    migrate(conn)
+    yield conn
+    conn.close()
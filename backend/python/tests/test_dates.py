@@ -0,0 +1,64 @@
+# backend/python/tests/test_dates.py
+
+import pytest
+
+from extract import normalize_date, normalize_lease_dates
+
+
+@pytest.mark.parametrize(
+    "raw, expected",
+    [
+        ("2024-02-01", ("2024-02-01", "high")),
+        ("2024/2/1", ("2024-02-01", "high")),
+        ("1/15/2024", ("2024-01-15", "high")),
+        ("15/1/2024", ("2024-01-15", "high")),      # only valid as day/month
+        ("03/04/2024", ("2024-03-04", "ambiguous")),  # US order by default
+        ("04/04/2024", ("2024-04-04", "high")),     # same either way
+        ("1/1/99", ("1999-01-01", "high")),
+        ("1/1/24", ("2024-01-01", "high")),
+        ("January 1, 2024", ("2024-01-01", "high")),
+        ("Jan. 1st 2024", ("2024-01-01", "high")),
+        ("1 January 2024", ("2024-01-01", "high")),
+        (" 2/29/2024. ", ("2024-02-29", "high")),
+        ("2/29/2023", (None, None)),                 # not a leap year
+        ("02/30/2024", (None, None)),
+        ("13/13/2024", (None, None)),
+        ("Smarch 1, 2024", (None, None)),
+        ("", (None, None)),
+        (None, (None, None)),
+    ],
+)
+def test_normalize_date(raw, expected):
+    assert normalize_date(raw) == expected
+
+
+def test_day_first_flips_only_ambiguous_dates():
+    assert normalize_date("03/04/2024", day_first=True) == ("2024-04-03", "ambiguous")
+    assert normalize_date("1/15/2024", day_first=True) == ("2024-01-15", "high")
+
+
+@pytest.mark.parametrize(
+    "values, expected",
+    [
+        # a day > 12 in either position settles the whole document
+        (["25/03/2024", "03/04/2025"], (["2024-03-25", "2025-04-03"], "high")),
+        (["03/25/2024", "03/04/2025"], (["2024-03-25", "2025-03-04"], "high")),
+        # leases starting on the 1st: only one reading puts both dates there
+        (["2/01/2024", "1/01/2029"], (["2024-02-01", "2029-01-01"], "high")),
+        (["1/02/2024", "1/03/2025"], (["2024-02-01", "2025-03-01"], "high")),
+        (["1/01/2024", "1/01/2025"], (["2024-01-01", "2025-01-01"], "high")),
+        # no evidence either way: US order, flagged
+        (["03/04/2024", "05/06/2025"], (["2024-03-04", "2025-05-06"], "ambiguous")),
+        (["2024-01-01", "03/04/2025"], (["2024-01-01", "2025-03-04"], "ambiguous")),
+        # contradictory evidence: each date read the way it parses, flagged
+        (["25/03/2024", "03/25/2025"], (["2024-03-25", "2025-03-25"], "ambiguous")),
+        (["13/02/2024", "2/13/2025"], (["2024-02-13", "2025-02-13"], "ambiguous")),
+        (["13/02/2024", "2/13/2025", "03/04/2026"],
+         (["2024-02-13", "2025-02-13", "2026-03-04"], "ambiguous")),
+        # unparseable values stay None
+        (["garbage", "1/15/2024"], ([None, "2024-01-15"], "high")),
+        ([None, ""], ([None, None], None)),
+    ],
+)
+def test_normalize_lease_dates(values, expected):
+    assert normalize_lease_dates(values) == expected
@@ -0,0 +1,108 @@
+# backend/python/tests/test_extract_async.py
+
+import asyncio
+import time
+
+import pytest
+
+import extract_async
+from extract_async import AsyncExtractor
+
+
+def fake_extract(path, fields=None):
+    """Picklable stand-in for extract_data: "<seconds>" sleeps, "boom" raises."""
+    if path == "boom":
+        raise ValueError("not a PDF")
+    time.sleep(float(path))
+    return {"structured": {"path": path}, "fields": fields}
+
+
+@pytest.fixture(autouse=True)
+def stand_in(monkeypatch):
+    monkeypatch.setattr(extract_async, "extract_data", fake_extract)
+    yield
+    extract_async.shutdown_default()
+
+
+def test_results_stream_in_completion_order():
+    async def main():
+        async with AsyncExtractor(max_workers=3) as extractor:
+            return [p async for p, _ in extractor.iter_extract(["0.8", "0.05", "0.4"])]
+
+    assert asyncio.run(main()) == ["0.05", "0.4", "0.8"]
+
+
+def test_source_is_read_only_as_slots_free_up():
+    pulled = 0
+
+    def paths():
+        nonlocal pulled
+        for _ in range(12):
+            pulled += 1
+            yield "0.02"
+
+    async def main():
+        seen = 0
+        async with AsyncExtractor(max_workers=2, max_in_flight=3) as extractor:
+            async for _, result in extractor.iter_extract(paths(), fields={"tenant"}):
+                seen += 1
+                assert result["fields"] == {"tenant"}
+                # the yielded document is done; at most 2 more are in flight
+                assert pulled - seen <= 2
+        return seen
+
+    assert asyncio.run(main()) == 12
+
+
+def test_extract_calls_are_capped_in_flight():
+    async def main():
+        async with AsyncExtractor(max_workers=1, max_in_flight=2) as extractor:
+            await extractor.extract("0")  # start the pool
+            submitted = []
+            submit = extractor._pool.submit
+            extractor._pool.submit = lambda *a, **kw: submitted.append(1) or submit(*a, **kw)
+
+            tasks = [asyncio.ensure_future(extractor.extract("0.3")) for _ in range(5)]
+            await asyncio.sleep(0.1)
+            in_pool = len(submitted)
+            await asyncio.gather(*tasks)
+            return in_pool, len(submitted)
+
+    # one worker, but only two documents handed to the pool at a time
+    assert asyncio.run(main()) == (2, 5)
+
+
+def test_failure_is_yielded_in_place_of_the_result():
+    async def main():
+        async with AsyncExtractor(max_workers=2) as extractor:
+            return dict([item async for item in extractor.iter_extract(["boom", "0"])])
+
+    results = asyncio.run(main())
+    assert isinstance(results["boom"], ValueError)
+    assert results["0"]["structured"] == {"path": "0"}
+
+
+def test_closing_the_iterator_cancels_pending_work():
+    async def main():
+        async with AsyncExtractor(max_workers=1, max_in_flight=4) as extractor:
+            start = time.monotonic()
+            stream = extractor.iter_extract(["0.1"] + ["2"] * 20)
+            async for path, _ in stream:
+                break
+            await stream.aclose()
+            return time.monotonic() - start
+
+    # without cancellation the queued 2 s documents would keep the pool busy
+    assert asyncio.run(main()) < 5
+
+
+def test_default_extractor_survives_successive_event_loops():
+    async def main():
+        # contend on the semaphore so it binds to this loop
+        extract_async._default_extractor().max_in_flight = 1
+        return await asyncio.gather(
+            *(extract_async.extract_data_async("0") for _ in range(3))
+        )
+
+    assert len(asyncio.run(main())) == 3
+    assert len(asyncio.run(main())) == 3
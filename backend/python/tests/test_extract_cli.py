@@ -0,0 +1,48 @@
+# backend/python/tests/test_extract_cli.py
+
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+PYTHON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+LEASE_PDF = os.path.join(PYTHON_DIR, "..", "lease_1.pdf")
+
+
+def run_extract(*args):
+    proc = subprocess.run(
+        [sys.executable, os.path.join(PYTHON_DIR, "extract.py"), *args],
+        capture_output=True,
+        text=True,
+        timeout=60,
+    )
+    return proc.returncode, json.loads(proc.stdout)
+
+
+@pytest.mark.parametrize(
+    "args, message",
+    [
+        ([], "No PDF path provided"),
+        (["--bogus", LEASE_PDF], "Unknown option: --bogus"),
+        ([LEASE_PDF, LEASE_PDF], "Expected one PDF path, got 2"),
+        (["--fields=tenant,nope", LEASE_PDF], "Unknown field(s) for --fields: nope"),
+        (["--fields=", LEASE_PDF], "No field names given for --fields"),
+        (["missing.pdf"], "PDF not found: missing.pdf"),
+    ],
+)
+def test_bad_arguments_report_json_errors(args, message):
+    code, out = run_extract(*args)
+    assert code == 1
+    assert out["error"].startswith(message)
+
+
+@pytest.mark.skipif(not os.path.exists(LEASE_PDF), reason="sample lease not present")
+def test_fields_accepts_optional_and_flyer_fields():
+    pytest.importorskip("pdfplumber")
+    code, out = run_extract("--fields=tenant,renewal_term_years,contacts", LEASE_PDF)
+    assert code == 0
+    assert set(out["structured"]) <= {"doc_type", "tenant", "renewal_term_years"}
+    assert "raw_text" not in out
@@ -0,0 +1,142 @@
+# backend/python/tests/test_lease_index.py
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from lease_index import LeaseIndex, LiveLeaseIndex, backfill_lease_dates, sql_occupied
+
+
+BASE = date(2020, 1, 1)
+
+
+def _random_leases(rng, n, first_id=1):
+    leases = []
+    for unit_id in range(first_id, first_id + n):
+        start = BASE + timedelta(days=rng.randint(0, 3000))
+        end = start + timedelta(days=rng.randint(0, 2000))
+        leases.append((unit_id, start, end))
+    return leases
+
+
+def _occupied(leases, on):
+    return sorted(uid for uid, s, e in leases if s <= on <= e)
+
+
+def _expiring(leases, start, end):
+    return sorted(uid for uid, s, e in leases if start <= e <= end)
+
+
+def _probe_dates(rng, leases, count=200):
+    # random days plus exact interval endpoints, where off-by-ones live
+    days = [BASE + timedelta(days=rng.randint(-100, 5200)) for _ in range(count)]
+    for _, s, e in rng.sample(leases, min(count, len(leases))):
+        days.extend([s, e])
+    return days
+
+
+def test_static_index_matches_brute_force():
+    rng = random.Random(1)
+    leases = _random_leases(rng, 2000)
+    index = LeaseIndex(leases)
+
+    assert len(index) == len(leases)
+    for day in _probe_dates(rng, leases):
+        expected = _occupied(leases, day)
+        assert sorted(index.occupied_on(day)) == expected
+        assert index.occupancy_count(day) == len(expected)
+
+        until = day + timedelta(days=rng.randint(0, 400))
+        got = index.expiring(day, until)
+        assert sorted(got) == _expiring(leases, day, until)
+        ends = {uid: e for uid, _, e in leases}
+        assert [ends[uid] for uid in got] == sorted(ends[uid] for uid in got)
+
+
+def test_static_index_accepts_iso_strings_and_skips_bad_leases():
+    index = LeaseIndex(
+        [
+            (1, "2024-01-01", "2024-12-31"),
+            (2, "2024-06-01", None),          # missing end
+            (3, "2025-01-01", "2024-01-01"),  # ends before it starts
+            (4, "not a date", "2024-12-31"),
+        ]
+    )
+    assert len(index) == 1
+    assert index.occupied_on("2024-06-30") == [1]
+    assert index.occupied_on(date(2025, 1, 1)) == []
+
+
+def test_empty_index():
+    index = LeaseIndex([])
+    assert index.occupied_on(BASE) == []
+    assert index.occupancy_count(BASE) == 0
+    assert index.expiring(BASE, BASE + timedelta(days=365)) == []
+
+
+def _insert(conn, leases, raw=False):
+    """Insert like server.js does (ISO columns set), or raw-only like old rows."""
+    with conn:
+        for _, s, e in leases:
+            if raw:
+                conn.execute(
+                    "INSERT INTO units (lease_start, lease_end) VALUES (?, ?)",
+                    (s.strftime("%B %d, %Y"), e.strftime("%B %d, %Y")),
+                )
+            else:
+                conn.execute(
+                    "INSERT INTO units (lease_start, lease_end, lease_start_iso, "
+                    "lease_end_iso, lease_date_confidence) VALUES (?, ?, ?, ?, 'high')",
+                    (s.isoformat(), e.isoformat(), s.isoformat(), e.isoformat()),
+                )
+
+
+def test_backfill_normalizes_raw_rows_once(conn):
+    with conn:
+        conn.execute("INSERT INTO units (lease_start, lease_end) VALUES ('2/01/2024', '1/01/2029')")
+        conn.execute("INSERT INTO units (lease_start, lease_end) VALUES ('n/a', NULL)")
+
+    assert backfill_lease_dates(conn) == 2
+    rows = conn.execute(
+        "SELECT lease_start_iso, lease_end_iso, lease_date_confidence FROM units ORDER BY id"
+    ).fetchall()
+    assert [tuple(r) for r in rows] == [
+        ("2024-02-01", "2029-01-01", "high"),
+        (None, None, "unparsed"),
+    ]
+    assert backfill_lease_dates(conn) == 0
+
+
+@pytest.mark.parametrize("rebuild_min", [1, 1024])
+def test_live_index_tracks_inserts(conn, rebuild_min):
+    rng = random.Random(rebuild_min)
+    leases = _random_leases(rng, 300)
+    _insert(conn, leases)
+    live = LiveLeaseIndex(conn, rebuild_min=rebuild_min)
+
+    for round_ in range(10):
+        batch = _random_leases(rng, rng.randint(1, 40), first_id=len(leases) + 1)
+        _insert(conn, batch, raw=round_ % 3 == 0)
+        leases += batch
+        ends = {uid: e for uid, _, e in leases}
+
+        assert len(live) == len(leases)
+        for day in _probe_dates(rng, leases, count=20):
+            expected = _occupied(leases, day)
+            assert sorted(live.occupied_on(day)) == expected
+            assert live.occupancy_count(day) == len(expected)
+            assert [r["id"] for r in sql_occupied(conn, day.isoformat())] == expected
+
+            until = day + timedelta(days=180)
+            got = live.expiring(day, until)
+            assert sorted(got) == _expiring(leases, day, until)
+            assert [ends[uid] for uid in got] == sorted(ends[uid] for uid in got)
+
+
+def test_live_expiring_is_soonest_first_across_new_rows(conn):
+    _insert(conn, [(1, date(2024, 1, 1), date(2025, 6, 1))])
+    live = LiveLeaseIndex(conn)
+    _insert(conn, [(2, date(2024, 1, 1), date(2025, 2, 1))])
+
+    assert live.expiring(date(2025, 1, 1), date(2025, 12, 31)) == [2, 1]
@@ -0,0 +1,129 @@
+# backend/python/tests/test_ocr.py
+
+import os
+import threading
+
+import pytest
+from PIL import Image
+
+import ocr
+
+
+class FakeTesseract:
+    """Stands in for pytesseract: the "text" of an image is its colour."""
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_tesseract_version(self):
+        return "5.0.0"
+
+    def image_to_string(self, image):
+        colour = image.getpixel((0, 0))
+        with self._lock:
+            self.calls.append(colour)
+        if colour in self.fail_on:
+            raise RuntimeError("tesseract exited with status 1")
+        return "text %d,%d,%d" % colour
+
+
+class FakePage:
+    def __init__(self, colour=None):
+        # colour=None: a text page with no images
+        self.colour = colour
+        self.images = [{"name": "scan"}] if colour else []
+
+    def to_image(self, resolution):
+        return type("PageImage", (), {"original": Image.new("RGB", (8, 8), self.colour)})
+
+
+class FakePDF:
+    def __init__(self, pages):
+        self.pages = pages
+
+
+RED, GREEN, BLUE = (255, 0, 0), (0, 255, 0), (0, 0, 255)
+
+
+@pytest.fixture
+def tesseract(monkeypatch, tmp_path):
+    fake = FakeTesseract()
+    monkeypatch.setattr(ocr, "pytesseract", fake)
+    monkeypatch.setattr(ocr, "OCR_CACHE_DIR", str(tmp_path / "ocr"))
+    return fake
+
+
+def _cached_files():
+    if not os.path.isdir(ocr.OCR_CACHE_DIR):
+        return []
+    return [f for _, _, files in os.walk(ocr.OCR_CACHE_DIR) for f in files]
+
+
+def test_is_image_only():
+    assert ocr.is_image_only(FakePage(RED), "")
+    assert ocr.is_image_only(FakePage(RED), " \n")
+    assert not ocr.is_image_only(FakePage(RED), "Lease")
+    assert not ocr.is_image_only(FakePage(), "")
+
+
+def test_only_image_pages_are_ocrd_and_duplicates_once(tesseract):
+    pdf = FakePDF([FakePage(), FakePage(RED), FakePage(GREEN), FakePage(RED), FakePage()])
+    texts = ["Lease", "", "", "", ""]
+
+    ocr.fill_missing_text(pdf, texts, max_workers=2)
+
+    assert texts == ["Lease", "text 255,0,0", "text 0,255,0", "text 255,0,0", ""]
+    assert sorted(tesseract.calls) == sorted([RED, GREEN])
+
+
+def test_cache_hit_skips_tesseract(tesseract):
+    pdf = FakePDF([FakePage(RED), FakePage(GREEN)])
+    ocr.fill_missing_text(pdf, ["", ""])
+    tesseract.calls.clear()
+
+    texts = ["", ""]
+    ocr.fill_missing_text(pdf, texts)
+
+    assert texts == ["text 255,0,0", "text 0,255,0"]
+    assert tesseract.calls == []
+
+
+def test_failed_page_is_left_empty_and_not_cached(tesseract, capsys):
+    tesseract.fail_on = {GREEN}
+    pdf = FakePDF([FakePage(RED), FakePage(GREEN), FakePage(BLUE)])
+    texts = ["", "", ""]
+
+    ocr.fill_missing_text(pdf, texts)
+
+    assert texts == ["text 255,0,0", "", "text 0,0,255"]
+    assert "OCR failed for page 2" in capsys.readouterr().err
+    assert len(_cached_files()) == 2
+
+    # retried (and now cached) once tesseract works again
+    tesseract.fail_on = set()
+    texts = ["", "", ""]
+    ocr.fill_missing_text(pdf, texts)
+    assert texts[1] == "text 0,255,0"
+    assert tesseract.calls.count(GREEN) == 2
+
+
+def test_many_pages_through_a_small_window(tesseract):
+    colours = [(i, i, i) for i in range(1, 41)]
+    pdf = FakePDF([FakePage(c) for c in colours])
+    texts = [""] * len(colours)
+
+    ocr.fill_missing_text(pdf, texts, max_workers=2)
+
+    assert texts == ["text %d,%d,%d" % c for c in colours]
+
+
+def test_without_tesseract_text_is_unchanged(monkeypatch, capsys):
+    monkeypatch.setattr(ocr, "pytesseract", None)
+    texts = ["", "Lease"]
+
+    ocr.fill_missing_text(FakePDF([FakePage(RED), FakePage()]), texts)
+
+    assert texts == ["", "Lease"]
+    assert "OCR skipped for 1 image-only page(s)" in capsys.readouterr().err
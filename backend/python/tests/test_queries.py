@@ -0,0 +1,97 @@
+# backend/python/tests/test_queries.py
+
+import random
+
+import pytest
+
+from queries import QueryLayer, install
+
+
+SAMPLE_UNITS = ["21", "13", "2", "101", "B-12"]
+
+
+def _add_units(conn, unit_numbers, rents=None):
+    with conn:
+        conn.execute(
+            "INSERT INTO properties (property_name, address, doc_type) VALUES (?, ?, ?)",
+            ("Federal Center", "9201 Federal Blvd", "lease"),
+        )
+        conn.executemany(
+            "INSERT INTO units (property_id, unit_number, rent_amount) VALUES (1, ?, ?)",
+            zip(unit_numbers, rents or [1000.0] * len(unit_numbers)),
+        )
+
+
+def _all_pages(fetch, limit):
+    ids, after = [], 0
+    while True:
+        page = fetch(after_id=after, limit=limit)
+        ids.extend(row["id"] for row in page["rows"])
+        if page["next_after"] is None:
+            return ids
+        after = page["next_after"]
+
+
+def _like_oracle(conn, term, min_rent=None, max_rent=None):
+    """What GET /search in server.js returns."""
+    query, params = "SELECT id FROM units WHERE unit_number LIKE ?", [f"%{term}%"]
+    if min_rent is not None:
+        query += " AND rent_amount >= ?"
+        params.append(min_rent)
+    if max_rent is not None:
+        query += " AND rent_amount <= ?"
+        params.append(max_rent)
+    return [row[0] for row in conn.execute(query + " ORDER BY id", params)]
+
+
+@pytest.mark.parametrize("term", ["1", "2", "12", "b-1", "101"])
+def test_search_units_is_substring_for_every_length(conn, term):
+    _add_units(conn, SAMPLE_UNITS)
+    install(conn)
+    result = QueryLayer(conn).search_units(unit_number=term)
+    assert [row["id"] for row in result["rows"]] == _like_oracle(conn, term)
+
+
+def test_single_character_matches_anywhere(conn):
+    _add_units(conn, SAMPLE_UNITS)
+    install(conn)
+    rows = QueryLayer(conn).search_units(unit_number="1")["rows"]
+    assert sorted(row["unit_number"] for row in rows) == ["101", "13", "21", "B-12"]
+
+
+def test_like_wildcards_are_literal(conn):
+    _add_units(conn, ["10%", "100", "1_0", "110"])
+    install(conn)
+    layer = QueryLayer(conn)
+    assert [r["unit_number"] for r in layer.search_units(unit_number="%")["rows"]] == ["10%"]
+    assert [r["unit_number"] for r in layer.search_units(unit_number="1_")["rows"]] == ["1_0"]
+
+
+def test_keyset_pages_match_oracle(conn):
+    rng = random.Random(7)
+    numbers = [str(rng.randint(1, 2000)) for _ in range(3000)]
+    rents = [float(rng.randint(500, 5000)) for _ in numbers]
+    _add_units(conn, numbers, rents)
+    install(conn)
+    layer = QueryLayer(conn)
+
+    for term, lo, hi in [("12", None, None), ("7", 1000, 3000), ("123", None, 2500), (None, 4000, None)]:
+        expected = _like_oracle(conn, term or "", lo, hi)
+        got = _all_pages(
+            lambda **page: layer.search_units(unit_number=term, min_rent=lo, max_rent=hi, **page),
+            limit=37,
+        )
+        assert got == expected
+
+    assert _all_pages(layer.list_units, limit=250) == list(range(1, 3001))
+
+
+def test_cached_page_is_dropped_after_insert(conn):
+    _add_units(conn, SAMPLE_UNITS)
+    install(conn)
+    layer = QueryLayer(conn)
+    assert len(layer.search_units(unit_number="2")["rows"]) == 3
+
+    with conn:
+        conn.execute("INSERT INTO units (property_id, unit_number) VALUES (1, '42')")
+    assert len(layer.search_units(unit_number="2")["rows"]) == 4
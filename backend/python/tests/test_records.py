@@ -0,0 +1,122 @@
+# backend/python/tests/test_records.py
+
+import glob
+import os
+
+import pytest
+
+from extract import parse_flyer, parse_lease
+from records import (
+    FlyerRecord,
+    LeaseRecord,
+    dumps_compact,
+    from_structured,
+    loads_compact,
+)
+
+
+SAMPLE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..")
+
+
+def _lease(**values):
+    # start from parse_lease's own dict so key order is the real one
+    data = parse_lease("")
+    data.update(
+        property_name="Acme Holdings LLC",
+        tenant="Tenant 1 Office",
+        suite="21",
+        square_feet=1250.0,
+        base_rent=2500.0,
+        lease_start="2/01/2024",
+        lease_end="1/01/2029",
+        unit_type="Office",
+        additional_features=["Two reserved parking spaces", "24/7 access"],
+        rent_escalation_percent=3.0,
+        lease_start_iso="2024-02-01",
+        lease_end_iso="2029-01-01",
+        lease_date_confidence="high",
+    )
+    data.update(values)
+    return data
+
+
+def _flyer(**values):
+    data = parse_flyer("")
+    data.update(
+        property_name="9201 FEDERAL BOULEVARD",
+        address="Westminster, CO 80221",
+        available_sf=13990.0,
+        lease_rate_psf=14.5,
+        lease_rate_type="NNN",
+        year_built=1979,
+        contacts=[
+            {"name": "Jane Broker", "phone": "303.555.0100", "email": "jane@example.com"},
+            {"name": "Sam Agent", "phone": None, "email": None},
+        ],
+    )
+    data.update(values)
+    return data
+
+
+def _assert_same(a, b):
+    assert a == b
+    assert list(a) == list(b)
+
+
+def test_lease_round_trip_without_renewal_term():
+    data = _lease()
+    assert "renewal_term_years" not in data
+    record = from_structured(data)
+    assert isinstance(record, LeaseRecord)
+    _assert_same(record.to_dict(), data)
+
+
+def test_lease_round_trip_with_renewal_term():
+    data = _lease()
+    data["renewal_term_years"] = 5    # parse_lease appends it when found
+    _assert_same(from_structured(data).to_dict(), data)
+
+
+def test_empty_parser_output_round_trips():
+    _assert_same(from_structured(parse_lease("")).to_dict(), parse_lease(""))
+    _assert_same(from_structured(parse_flyer("")).to_dict(), parse_flyer(""))
+
+
+def test_flyer_round_trip():
+    record = from_structured(_flyer())
+    assert isinstance(record, FlyerRecord)
+    _assert_same(record.to_dict(), _flyer())
+
+
+def test_compact_round_trip_over_mixed_records():
+    with_renewal = _lease(suite="22")
+    with_renewal["renewal_term_years"] = 3
+    dicts = [_lease(), _flyer(), with_renewal, _flyer(contacts=[]), parse_lease("")]
+
+    records = [from_structured(d) for d in dicts]
+    loaded = loads_compact(dumps_compact(records))
+
+    # rows are grouped by doc type, in input order within each group
+    expected = [d for d in dicts if d["doc_type"] == "lease"] + [
+        d for d in dicts if d["doc_type"] == "flyer"
+    ]
+    assert loaded == [r for r in records if r.doc_type == "lease"] + [
+        r for r in records if r.doc_type == "flyer"
+    ]
+    for record, data in zip(loaded, expected):
+        _assert_same(record.to_dict(), data)
+
+
+@pytest.mark.parametrize(
+    "pdf_path",
+    sorted(glob.glob(os.path.join(SAMPLE_DIR, "*.pdf"))),
+    ids=os.path.basename,
+)
+def test_sample_pdfs_round_trip(pdf_path):
+    pytest.importorskip("pdfplumber")
+    from extract import extract_data
+
+    structured = extract_data(pdf_path)["structured"]
+    record = from_structured(structured)
+    _assert_same(record.to_dict(), structured)
+    _assert_same(loads_compact(dumps_compact([record]))[0].to_dict(), structured)
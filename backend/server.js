@@ -2,7 +2,8 @@
 import express from "express";
 import cors from "cors";
 import fileUpload from "express-fileupload";
-import { exec } from "child_process";
+import { exec, spawn } from "child_process";
+import crypto from "crypto";
 import path from "path";
 import { fileURLToPath } from "url";
 import db from "./database.js";
@@ -16,6 +17,24 @@ app.options("*", cors());
 app.use(express.json());
 app.use(fileUpload());
 
+// Pre-rendered page thumbnails/rasters written by python/render.py
+app.use("/page-cache", express.static(path.join(__dirname, "cache", "pages")));
+
+// Render page previews in a detached process so /extract never waits on it.
+// The cache is keyed by the PDF's SHA-256, which is also how the client finds
+// the manifest (it 404s until rendering has finished).
+function renderPagesInBackground(savePath, pdfData) {
+    const digest = crypto.createHash("sha256").update(pdfData).digest("hex");
+    const child = spawn(
+        "python3",
+        [path.join(__dirname, "python", "render.py"), savePath],
+        { detached: true, stdio: "ignore" }
+    );
+    child.on("error", (err) => console.error("Page render error:", err));
+    child.unref();
+    return `/page-cache/${digest}/manifest.json`;
+}
+
 // Upload a PDF, run the Python extractor, save to SQLite, and return data
 app.post("/extract", (req, res) => {
     console.log("Files received:", req.files);
@@ -57,6 +76,7 @@ app.post("/extract", (req, res) => {
             }
 
             const { structured } = extracted;
+            const pagesManifest = renderPagesInBackground(savePath, pdf.data);
             const docType = structured.doc_type || "lease";
 
             if (docType === "flyer") {
@@ -85,6 +105,7 @@ app.post("/extract", (req, res) => {
                     message: "Flyer PDF processed",
                     propertyId,
                     structured,
+                    pagesManifest,
                 });
             } else {
 
@@ -108,9 +129,13 @@ app.post("/extract", (req, res) => {
             tenant_name,
             lease_start,
             lease_end,
-            sq_ft
+            sq_ft,
+            rent_escalation_percent,
+            lease_start_iso,
+            lease_end_iso,
+            lease_date_confidence
           )
-          VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+          VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
         `);
 
                 unitStmt.run(
@@ -121,13 +146,18 @@ app.post("/extract", (req, res) => {
                     structured.tenant || "",
                     structured.lease_start || "",
                     structured.lease_end || "",
-                    structured.square_feet || null
+                    structured.square_feet || null,
+                    structured.rent_escalation_percent ?? null,
+                    structured.lease_start_iso || null,
+                    structured.lease_end_iso || null,
+                    structured.lease_date_confidence || null
                 );
 
                 return res.send({
                     message: "Lease PDF processed",
                     propertyId,
                     structured,
+                    pagesManifest,
                 });
             }
         });
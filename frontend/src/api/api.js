@@ -11,3 +11,9 @@ export const getProperties = () => axios.get(`${API_BASE}/properties`);
 export const getUnits = () => axios.get(`${API_BASE}/units`);
 export const searchUnits = (params) =>
     axios.get(`${API_BASE}/search`, { params });
+
+// Page previews rendered in the background after /extract (404 until ready)
+export const getPageManifest = (manifestPath) =>
+    axios.get(`${API_BASE}${manifestPath}`);
+export const pageCacheUrl = (manifestPath, name) =>
+    `${API_BASE}${manifestPath.replace(/manifest\.json$/, name)}`;
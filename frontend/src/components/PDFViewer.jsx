@@ -1,12 +1,17 @@
 // frontend/src/components/PDFViewer.jsx
 import React, { useState, useEffect } from "react";
 import { Document, Page, pdfjs } from "react-pdf";
+import { getPageManifest, pageCacheUrl } from "../api/api";
 
 
 pdfjs.GlobalWorkerOptions.workerSrc = `https://unpkg.com/pdfjs-dist@${pdfjs.version}/build/pdf.worker.min.mjs`;
 
 const PAGE_RENDER_WIDTH = 400;
 
+// The backend renders page previews after responding; poll for the manifest
+const PREVIEW_POLL_MS = 1000;
+const PREVIEW_POLL_ATTEMPTS = 30;
+
 
 // Renders the extracted data in the right pane
 function RenderExtracted({ extracted }) {
@@ -260,10 +265,56 @@ function RenderExtracted({ extracted }) {
 }
 
 // Main PDF viewer + extracted data side-by-side
-export default function PDFViewer({ fileUrl, extracted }) {
+export default function PDFViewer({ fileUrl, extracted, pagesManifest }) {
     const [numPages, setNumPages] = useState(null);
     const [pdfDoc, setPdfDoc] = useState(null);
     const [highlights, setHighlights] = useState({});
+    const [previews, setPreviews] = useState(null);
+
+    useEffect(() => {
+        setPreviews(null);
+        if (!pagesManifest) return;
+
+        let cancelled = false;
+        let attempts = 0;
+        const poll = async () => {
+            try {
+                const res = await getPageManifest(pagesManifest);
+                if (!cancelled) setPreviews(res.data);
+            } catch (err) {
+                // Not rendered yet; try again shortly
+                attempts += 1;
+                if (!cancelled && attempts < PREVIEW_POLL_ATTEMPTS) {
+                    setTimeout(poll, PREVIEW_POLL_MS);
+                }
+            }
+        };
+        poll();
+
+        return () => {
+            cancelled = true;
+        };
+    }, [pagesManifest]);
+
+    // Shown while pdf.js parses the document / renders a page: the
+    // mid-resolution raster, with the thumbnail behind it until it arrives
+    const pagePreview = (pageNum) => {
+        const preview = previews?.pages?.[pageNum - 1];
+        if (!preview) return <div>Loading page {pageNum}...</div>;
+        return (
+            <img
+                src={pageCacheUrl(pagesManifest, preview.raster)}
+                alt={`Page ${pageNum} preview`}
+                width={PAGE_RENDER_WIDTH}
+                height={Math.round((PAGE_RENDER_WIDTH * preview.height) / preview.width)}
+                style={{
+                    display: "block",
+                    backgroundImage: `url(${pageCacheUrl(pagesManifest, preview.thumbnail)})`,
+                    backgroundSize: "100% 100%",
+                }}
+            />
+        );
+    };
 
     const onDocumentLoadSuccess = (doc) => {
         setNumPages(doc.numPages);
@@ -499,6 +550,15 @@ export default function PDFViewer({ fileUrl, extracted }) {
                     file={fileUrl || null}
                     onLoadError={(error) => console.error("PDF load error:", error)}
                     onLoadSuccess={onDocumentLoadSuccess}
+                    loading={
+                        previews
+                            ? previews.pages.map((p) => (
+                                  <div key={`preview_${p.page}`} style={{ marginBottom: 20 }}>
+                                      {pagePreview(p.page)}
+                                  </div>
+                              ))
+                            : "Loading PDF..."
+                    }
                 >
                     {numPages &&
                         Array.from({ length: numPages }, (_, index) => {
@@ -511,7 +571,11 @@ export default function PDFViewer({ fileUrl, extracted }) {
                                         marginBottom: 20,
                                     }}
                                 >
-                                    <Page pageNumber={pageNum} width={PAGE_RENDER_WIDTH} />
+                                    <Page
+                                        pageNumber={pageNum}
+                                        width={PAGE_RENDER_WIDTH}
+                                        loading={pagePreview(pageNum)}
+                                    />
                                     {(highlights[pageNum] || []).map((h, i) => (
                                         <div
                                             key={i}
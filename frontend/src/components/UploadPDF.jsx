@@ -7,6 +7,7 @@ export default function UploadPDF() {
     const [file, setFile] = useState(null);
     const [result, setResult] = useState(null);
     const [fileUrl, setFileUrl] = useState(null);
+    const [pagesManifest, setPagesManifest] = useState(null);
 
     const handleUpload = async () => {
         if (!file) {
@@ -18,6 +19,7 @@ export default function UploadPDF() {
             const res = await uploadPDF(file);
             console.log("Upload response:", res.data);
             setResult(res.data.structured || res.data);
+            setPagesManifest(res.data.pagesManifest || null);
             setFileUrl(URL.createObjectURL(file));
         } catch (err) {
             console.error("Upload error:", err.response?.data || err.message);
@@ -36,6 +38,7 @@ export default function UploadPDF() {
                 onChange={(e) => {
                     setResult(null);
                     setFileUrl(null);
+                    setPagesManifest(null);
                     setFile(e.target.files[0]);
                 }}
             />
@@ -45,7 +48,11 @@ export default function UploadPDF() {
 
             {file && result && (
                 <div style={{ marginTop: 20 }}>
-                    <PDFViewer fileUrl={fileUrl} extracted={result} />
+                    <PDFViewer
+                        fileUrl={fileUrl}
+                        extracted={result}
+                        pagesManifest={pagesManifest}
+                    />
                 </div>
             )}
         </div>